@@ -83,17 +83,27 @@ pub(crate) fn unregister_abort_handle(
     }
 }
 
+const SMART_QUOTES: [char; 4] = ['\u{2018}', '\u{2019}', '\u{201C}', '\u{201D}'];
+
 /// Trims trailing semicolons and normalises Unicode smart quotes that some
 /// editors insert when the user pastes a query. Called on every query the
 /// UI hands off to a driver.
 fn sanitize_user_query(query: &str) -> String {
-    query
-        .trim()
-        .trim_end_matches(';')
-        .replace('\u{2018}', "'")
-        .replace('\u{2019}', "'")
-        .replace('\u{201C}', "\"")
-        .replace('\u{201D}', "\"")
+    let trimmed = query.trim().trim_end_matches(';');
+    // Almost no query carries smart quotes: skip the mapping pass unless one
+    // is actually present.
+    if !trimmed.contains(&SMART_QUOTES[..]) {
+        return trimmed.to_string();
+    }
+    // One pass maps every kind, rather than one full copy per replace
+    trimmed
+        .chars()
+        .map(|c| match c {
+            '\u{2018}' | '\u{2019}' => '\'',
+            '\u{201C}' | '\u{201D}' => '"',
+            other => other,
+        })
+        .collect()
 }
 
 // --- Persistence Helpers ---
@@ -290,6 +300,36 @@ pub fn resolve_connection_params_with_id(
     Ok(resolved)
 }
 
+/// Load a saved connection, resolve its params (SSH expansion, tunnel,
+/// pooling id) and look up its driver — the common preamble of every
+/// per-connection command.
+async fn connection_driver<R: Runtime>(
+    app: &AppHandle<R>,
+    connection_id: &str,
+) -> Result<
+    (
+        ConnectionParams,
+        Arc<dyn crate::drivers::driver_trait::DatabaseDriver>,
+    ),
+    String,
+> {
+    let saved_conn = find_connection_by_id(app, connection_id)?;
+    let expanded_params = expand_ssh_connection_params(app, &saved_conn.params).await?;
+    let params = resolve_connection_params_with_id(&expanded_params, connection_id)?;
+    let drv = driver_for(&saved_conn.params.driver).await?;
+    Ok((params, drv))
+}
+
+/// Look up the driver of a saved connection without resolving its params,
+/// for commands that only generate SQL and never open a connection.
+async fn saved_connection_driver<R: Runtime>(
+    app: &AppHandle<R>,
+    connection_id: &str,
+) -> Result<Arc<dyn crate::drivers::driver_trait::DatabaseDriver>, String> {
+    let saved_conn = find_connection_by_id(app, connection_id)?;
+    driver_for(&saved_conn.params.driver).await
+}
+
 pub fn get_config_path<R: Runtime>(app: &AppHandle<R>) -> Result<PathBuf, String> {
     let config_dir = app.path().app_config_dir().map_err(|e| e.to_string())?;
     if !config_dir.exists() {
@@ -370,11 +410,7 @@ pub async fn get_schemas<R: Runtime>(
 ) -> Result<Vec<String>, String> {
     log::info!("Fetching schemas for connection: {}", connection_id);
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.get_schemas(&params).await
 }
 
@@ -388,11 +424,7 @@ pub async fn get_available_databases<R: Runtime>(
         connection_id
     );
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.get_databases(&params).await
 }
 
@@ -404,11 +436,7 @@ pub async fn get_routines<R: Runtime>(
 ) -> Result<Vec<RoutineInfo>, String> {
     log::info!("Fetching routines for connection: {}", connection_id);
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.get_routines(&params, schema.as_deref()).await
 }
 
@@ -425,11 +453,7 @@ pub async fn get_routine_parameters<R: Runtime>(
         connection_id
     );
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.get_routine_parameters(&params, &routine_name, schema.as_deref())
         .await
 }
@@ -449,11 +473,7 @@ pub async fn get_routine_definition<R: Runtime>(
         connection_id
     );
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.get_routine_definition(&params, &routine_name, &routine_type, schema.as_deref())
         .await
 }
@@ -464,10 +484,7 @@ pub async fn get_schema_snapshot<R: Runtime>(
     connection_id: String,
     schema: Option<String>,
 ) -> Result<Vec<crate::models::TableSchema>, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.get_schema_snapshot(&params, schema.as_deref()).await
 }
 
@@ -770,25 +787,30 @@ pub async fn duplicate_connection<R: Runtime>(
 pub async fn get_connections<R: Runtime>(
     app: AppHandle<R>,
 ) -> Result<Vec<SavedConnection>, String> {
-    // Run migration if needed
-    migrate_ssh_connections(&app).await.ok();
-
     let path = get_config_path(&app)?;
     // Use persistence function that handles both old and new formats
-    persistence::load_connections(&path)
+    let mut conn_file = persistence::load_connections_file(&path)?;
+    // Run migration if needed on the file we just loaded
+    migrate_ssh_connections(&app, &path, &mut conn_file).await.ok();
+    Ok(conn_file.connections)
 }
 
 // ==================== SSH Connection Management ====================
 
-/// Migrates old embedded SSH connections to separate SSH connection entries
-async fn migrate_ssh_connections<R: Runtime>(app: &AppHandle<R>) -> Result<(), String> {
-    let conn_path = get_config_path(app)?;
+/// Migrates old embedded SSH connections to separate SSH connection entries.
+///
+/// Operates on a connections file the caller has already loaded so listing
+/// commands read `connections.json` once. `conn_file` is only replaced after
+/// the migrated version has been written to disk.
+async fn migrate_ssh_connections<R: Runtime>(
+    app: &AppHandle<R>,
+    conn_path: &std::path::Path,
+    conn_file: &mut ConnectionsFile,
+) -> Result<(), String> {
     if !conn_path.exists() {
         return Ok(()); // Nothing to migrate
     }
 
-    // Load connections using persistence (handles both old and new formats)
-    let mut conn_file = persistence::load_connections_file(&conn_path)?;
     let connections = &conn_file.connections;
 
     // Check if any connections have old embedded SSH params
@@ -891,11 +913,15 @@ async fn migrate_ssh_connections<R: Runtime>(app: &AppHandle<R>) -> Result<(), S
 
     // Save migrated SSH connections
     let ssh_json = serde_json::to_string_pretty(&ssh_connections).map_err(|e| e.to_string())?;
-    fs::write(ssh_path, ssh_json).map_err(|e| e.to_string())?;
+    persistence::write_atomic(&ssh_path, ssh_json)?;
 
     // Save migrated connections using new format (preserving groups)
-    conn_file.connections = migrated_connections;
-    persistence::save_connections_file(&conn_path, &conn_file)?;
+    let migrated_file = ConnectionsFile {
+        groups: conn_file.groups.clone(),
+        connections: migrated_connections,
+    };
+    persistence::save_connections_file(conn_path, &migrated_file)?;
+    *conn_file = migrated_file;
 
     println!(
         "[Migration] Successfully migrated {} SSH connections",
@@ -1038,7 +1064,7 @@ pub async fn save_ssh_connection<R: Runtime>(
 
     ssh_connections.push(ssh_to_save.clone());
     let json = serde_json::to_string_pretty(&ssh_connections).map_err(|e| e.to_string())?;
-    fs::write(path, json).map_err(|e| e.to_string())?;
+    persistence::write_atomic(&path, json)?;
 
     let mut returned_ssh = ssh_to_save;
     returned_ssh.password = ssh.password;
@@ -1106,7 +1132,7 @@ pub async fn update_ssh_connection<R: Runtime>(
     ssh_connections[ssh_idx] = ssh_to_save.clone();
 
     let json = serde_json::to_string_pretty(&ssh_connections).map_err(|e| e.to_string())?;
-    fs::write(path, json).map_err(|e| e.to_string())?;
+    persistence::write_atomic(&path, json)?;
 
     let mut returned_ssh = ssh_to_save;
     returned_ssh.password = ssh.password;
@@ -1138,7 +1164,7 @@ pub async fn delete_ssh_connection<R: Runtime>(
     credential_cache::invalidate_ssh_key_passphrase(&cache, &id);
 
     let json = serde_json::to_string_pretty(&ssh_connections).map_err(|e| e.to_string())?;
-    fs::write(path, json).map_err(|e| e.to_string())?;
+    persistence::write_atomic(&path, json)?;
     Ok(())
 }
 
@@ -1149,11 +1175,14 @@ pub async fn test_ssh_connection<R: Runtime>(
 ) -> Result<String, String> {
     use crate::ssh_tunnel;
 
-    // Resolve password using same logic as database connections
-    let resolved_password = resolve_ssh_test_password(
-        ssh.password.as_deref(),
-        ssh.connection_id.as_deref(),
-        |conn_id| {
+    // Password and passphrase lookups need the same saved entry: read the
+    // SSH connections file once, and only when the request lacks a credential
+    let needs_saved = ssh.password.is_none() || ssh.key_passphrase.is_none();
+    let saved_ssh: Option<SshConnection> = ssh
+        .connection_id
+        .as_deref()
+        .filter(|_| needs_saved)
+        .and_then(|conn_id| {
             let path = get_ssh_config_path(&app).ok()?;
             if !path.exists() {
                 return None;
@@ -1162,7 +1191,14 @@ pub async fn test_ssh_connection<R: Runtime>(
             let connections: Vec<SshConnection> =
                 serde_json::from_str(&content).unwrap_or_default();
             connections.into_iter().find(|c| c.id == conn_id)
-        },
+        });
+    let find_saved_ssh = |conn_id: &str| saved_ssh.as_ref().filter(|c| c.id == conn_id).cloned();
+
+    // Resolve password using same logic as database connections
+    let resolved_password = resolve_ssh_test_password(
+        ssh.password.as_deref(),
+        ssh.connection_id.as_deref(),
+        &find_saved_ssh,
         |conn_id| keychain_utils::get_ssh_password(conn_id, ""),
     );
 
@@ -1170,16 +1206,7 @@ pub async fn test_ssh_connection<R: Runtime>(
     let resolved_passphrase = resolve_ssh_test_credential(
         ssh.key_passphrase.as_deref(),
         ssh.connection_id.as_deref(),
-        |conn_id| {
-            let path = get_ssh_config_path(&app).ok()?;
-            if !path.exists() {
-                return None;
-            }
-            let content = fs::read_to_string(path).ok()?;
-            let connections: Vec<SshConnection> =
-                serde_json::from_str(&content).unwrap_or_default();
-            connections.into_iter().find(|c| c.id == conn_id)
-        },
+        &find_saved_ssh,
         |conn_id| keychain_utils::get_ssh_key_passphrase(conn_id, ""),
         |conn| {
             conn.key_passphrase
@@ -1300,6 +1327,20 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_sanitize_user_query_trims_trailing_semicolons() {
+        assert_eq!(sanitize_user_query("  SELECT 1;;  "), "SELECT 1");
+        assert_eq!(sanitize_user_query("SELECT 'a;b'"), "SELECT 'a;b'");
+    }
+
+    #[test]
+    fn test_sanitize_user_query_normalises_smart_quotes() {
+        assert_eq!(
+            sanitize_user_query("SELECT \u{2018}a\u{2019}, \u{201C}b\u{201D};"),
+            "SELECT 'a', \"b\""
+        );
+    }
+
     #[test]
     fn test_resolve_password_prefers_request() {
         let mut params = base_params();
@@ -1963,17 +2004,14 @@ pub async fn get_tables<R: Runtime>(
 ) -> Result<Vec<TableInfo>, String> {
     log::info!("Fetching tables for connection: {}", connection_id);
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
 
     log::debug!(
         "Getting tables from {} database: {}",
-        saved_conn.params.driver,
+        params.driver,
         params.database
     );
 
-    let drv = driver_for(&saved_conn.params.driver).await?;
     let result = drv.get_tables(&params, schema.as_deref()).await;
 
     match &result {
@@ -1991,10 +2029,7 @@ pub async fn get_columns<R: Runtime>(
     table_name: String,
     schema: Option<String>,
 ) -> Result<Vec<TableColumn>, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.get_columns(&params, &table_name, schema.as_deref())
         .await
 }
@@ -2006,10 +2041,7 @@ pub async fn get_foreign_keys<R: Runtime>(
     table_name: String,
     schema: Option<String>,
 ) -> Result<Vec<ForeignKey>, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.get_foreign_keys(&params, &table_name, schema.as_deref())
         .await
 }
@@ -2021,10 +2053,7 @@ pub async fn get_indexes<R: Runtime>(
     table_name: String,
     schema: Option<String>,
 ) -> Result<Vec<Index>, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.get_indexes(&params, &table_name, schema.as_deref())
         .await
 }
@@ -2046,13 +2075,10 @@ pub async fn delete_record<R: Runtime>(
         pk_col,
         pk_val
     );
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let mut params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
+    let (mut params, drv) = connection_driver(&app, &connection_id).await?;
     if let Some(db) = database {
         params.database = crate::models::DatabaseSelection::Single(db);
     }
-    let drv = driver_for(&saved_conn.params.driver).await?;
     drv.delete_record(&params, &table, &pk_col, pk_val, schema.as_deref())
         .await
 }
@@ -2078,14 +2104,11 @@ pub async fn update_record<R: Runtime>(
         pk_col,
         pk_val
     );
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let mut params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
+    let (mut params, drv) = connection_driver(&app, &connection_id).await?;
     if let Some(db) = database {
         params.database = crate::models::DatabaseSelection::Single(db);
     }
     let max_blob_size = crate::config::get_max_blob_size(&app);
-    let drv = driver_for(&saved_conn.params.driver).await?;
     drv.update_record(
         &params,
         &table,
@@ -2110,10 +2133,7 @@ pub async fn save_blob_to_file<R: Runtime>(
     file_path: String,
     schema: Option<String>,
 ) -> Result<(), String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.save_blob_to_file(
         &params,
         &table,
@@ -2138,10 +2158,7 @@ pub async fn fetch_blob_as_data_url<R: Runtime>(
     pk_val: serde_json::Value,
     schema: Option<String>,
 ) -> Result<String, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let wire = drv
         .fetch_blob_as_data_url(
             &params,
@@ -2284,7 +2301,6 @@ pub fn get_file_stats(file_path: String) -> Result<serde_json::Value, String> {
 /// Only available for image files; returns an error for non-image MIME types.
 #[tauri::command]
 pub async fn read_file_as_data_url(file_path: String) -> Result<String, String> {
-    use base64::Engine;
     use std::io::Read;
 
     tokio::task::spawn_blocking(move || -> Result<String, String> {
@@ -2310,8 +2326,10 @@ pub async fn read_file_as_data_url(file_path: String) -> Result<String, String>
             return Err(format!("Not an image file: {}", mime));
         }
 
-        let b64 = base64::engine::general_purpose::STANDARD.encode(&bytes);
-        Ok(format!("data:{};base64,{}", mime, b64))
+        Ok(crate::drivers::common::base64_with_prefix(
+            &format!("data:{};base64,", mime),
+            &bytes,
+        ))
     })
     .await
     .map_err(|e| format!("Task join error: {}", e))?
@@ -2333,14 +2351,11 @@ pub async fn insert_record<R: Runtime>(
         table,
         columns.join(", ")
     );
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let mut params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
+    let (mut params, drv) = connection_driver(&app, &connection_id).await?;
     if let Some(db) = database {
         params.database = crate::models::DatabaseSelection::Single(db);
     }
     let max_blob_size = crate::config::get_max_blob_size(&app);
-    let drv = driver_for(&saved_conn.params.driver).await?;
     drv.insert_record(&params, &table, data, schema.as_deref(), max_blob_size)
         .await
 }
@@ -2388,11 +2403,7 @@ pub async fn execute_query<R: Runtime>(
 
     let sanitized_query = sanitize_user_query(&query);
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let task = tokio::spawn(async move {
         drv.execute_query(
             &params,
@@ -2456,11 +2467,7 @@ pub async fn execute_query_batch<R: Runtime>(
 
     let sanitized_queries: Vec<String> = queries.iter().map(|q| sanitize_user_query(q)).collect();
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let task = tokio::spawn(async move {
         drv.execute_batch(
             &params,
@@ -2528,11 +2535,7 @@ pub async fn explain_query_plan<R: Runtime>(
         );
     }
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let task = tokio::spawn(async move {
         drv.explain_query(&params, &sanitized_query, analyze, schema.as_deref())
             .await
@@ -2570,15 +2573,12 @@ pub async fn count_query<R: Runtime>(
     query: String,
     schema: Option<String>,
 ) -> Result<u64, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
 
     let sanitized = query.trim().trim_end_matches(';').to_string();
 
     let count_q = format!("SELECT COUNT(*) FROM ({}) as count_wrapper", sanitized);
 
-    let drv = driver_for(&saved_conn.params.driver).await?;
     let result = drv
         .execute_query(&params, &count_q, None, 1, schema.as_deref())
         .await?;
@@ -2813,17 +2813,14 @@ pub async fn get_views<R: Runtime>(
 ) -> Result<Vec<crate::models::ViewInfo>, String> {
     log::info!("Fetching views for connection: {}", connection_id);
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
 
     log::debug!(
         "Getting views from {} database: {}",
-        saved_conn.params.driver,
+        params.driver,
         params.database
     );
 
-    let drv = driver_for(&saved_conn.params.driver).await?;
     let result = drv.get_views(&params, schema.as_deref()).await;
 
     match &result {
@@ -2847,11 +2844,7 @@ pub async fn get_view_definition<R: Runtime>(
         connection_id
     );
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let result = drv
         .get_view_definition(&params, &view_name, schema.as_deref())
         .await;
@@ -2878,11 +2871,7 @@ pub async fn create_view<R: Runtime>(
         connection_id
     );
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let result = drv
         .create_view(&params, &view_name, &definition, schema.as_deref())
         .await;
@@ -2909,11 +2898,7 @@ pub async fn alter_view<R: Runtime>(
         connection_id
     );
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let result = drv
         .alter_view(&params, &view_name, &definition, schema.as_deref())
         .await;
@@ -2939,11 +2924,7 @@ pub async fn drop_view<R: Runtime>(
         connection_id
     );
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let result = drv.drop_view(&params, &view_name, schema.as_deref()).await;
 
     match &result {
@@ -2967,11 +2948,7 @@ pub async fn get_view_columns<R: Runtime>(
         connection_id
     );
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let result = drv
         .get_view_columns(&params, &view_name, schema.as_deref())
         .await;
@@ -2992,11 +2969,7 @@ pub async fn get_triggers<R: Runtime>(
 ) -> Result<Vec<TriggerInfo>, String> {
     log::info!("Fetching triggers for connection: {}", connection_id);
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let result = drv.get_triggers(&params, schema.as_deref()).await;
 
     match &result {
@@ -3021,11 +2994,7 @@ pub async fn get_trigger_definition<R: Runtime>(
         connection_id
     );
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.get_trigger_definition(&params, &trigger_name, &table_name, schema.as_deref())
         .await
 }
@@ -3039,11 +3008,7 @@ pub async fn create_trigger<R: Runtime>(
 ) -> Result<(), String> {
     log::info!("Creating trigger on connection: {}", connection_id);
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let result = drv
         .create_trigger(&params, &trigger_sql, schema.as_deref())
         .await;
@@ -3070,11 +3035,7 @@ pub async fn drop_trigger<R: Runtime>(
         connection_id
     );
 
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     let result = drv
         .drop_trigger(&params, &trigger_name, &table_name, schema.as_deref())
         .await;
@@ -3151,8 +3112,7 @@ pub async fn get_create_table_sql<R: Runtime>(
     columns: Vec<ColumnDefinition>,
     schema: Option<String>,
 ) -> Result<Vec<String>, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let drv = saved_connection_driver(&app, &connection_id).await?;
     drv.get_create_table_sql(&table_name, columns, schema.as_deref())
         .await
 }
@@ -3165,8 +3125,7 @@ pub async fn get_add_column_sql<R: Runtime>(
     column: ColumnDefinition,
     schema: Option<String>,
 ) -> Result<Vec<String>, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let drv = saved_connection_driver(&app, &connection_id).await?;
     drv.get_add_column_sql(&table, column, schema.as_deref())
         .await
 }
@@ -3180,8 +3139,7 @@ pub async fn get_alter_column_sql<R: Runtime>(
     new_column: ColumnDefinition,
     schema: Option<String>,
 ) -> Result<Vec<String>, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let drv = saved_connection_driver(&app, &connection_id).await?;
     drv.get_alter_column_sql(&table, old_column, new_column, schema.as_deref())
         .await
 }
@@ -3196,8 +3154,7 @@ pub async fn get_create_index_sql<R: Runtime>(
     is_unique: bool,
     schema: Option<String>,
 ) -> Result<Vec<String>, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let drv = saved_connection_driver(&app, &connection_id).await?;
     drv.get_create_index_sql(&table, &index_name, columns, is_unique, schema.as_deref())
         .await
 }
@@ -3215,8 +3172,7 @@ pub async fn get_create_foreign_key_sql<R: Runtime>(
     on_update: Option<String>,
     schema: Option<String>,
 ) -> Result<Vec<String>, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let drv = saved_connection_driver(&app, &connection_id).await?;
     drv.get_create_foreign_key_sql(
         &table,
         &fk_name,
@@ -3238,10 +3194,7 @@ pub async fn drop_index_action<R: Runtime>(
     index_name: String,
     schema: Option<String>,
 ) -> Result<(), String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.drop_index(&params, &table, &index_name, schema.as_deref())
         .await
 }
@@ -3254,10 +3207,7 @@ pub async fn drop_foreign_key_action<R: Runtime>(
     fk_name: String,
     schema: Option<String>,
 ) -> Result<(), String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
-    let drv = driver_for(&saved_conn.params.driver).await?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
     drv.drop_foreign_key(&params, &table, &fk_name, schema.as_deref())
         .await
 }
@@ -3287,7 +3237,7 @@ pub async fn save_keybindings<R: Runtime>(
     fs::create_dir_all(&config_dir).map_err(|e| e.to_string())?;
     let path = config_dir.join("keybindings.json");
     let content = serde_json::to_string_pretty(&keybindings).map_err(|e| e.to_string())?;
-    fs::write(&path, content).map_err(|e| e.to_string())
+    persistence::write_atomic(&path, content)
 }
 
 #[tauri::command]
@@ -3313,11 +3263,11 @@ pub async fn get_connection_groups<R: Runtime>(
 pub async fn get_connections_with_groups<R: Runtime>(
     app: AppHandle<R>,
 ) -> Result<ConnectionsFile, String> {
-    // Run migration if needed
-    migrate_ssh_connections(&app).await.ok();
-
     let path = get_config_path(&app)?;
-    persistence::load_connections_file(&path)
+    let mut conn_file = persistence::load_connections_file(&path)?;
+    // Run migration if needed on the file we just loaded
+    migrate_ssh_connections(&app, &path, &mut conn_file).await.ok();
+    Ok(conn_file)
 }
 
 #[tauri::command]
@@ -3467,16 +3417,13 @@ pub async fn get_server_now<R: Runtime>(
     app: AppHandle<R>,
     connection_id: String,
 ) -> Result<String, String> {
-    let saved_conn = find_connection_by_id(&app, &connection_id)?;
-    let expanded_params = expand_ssh_connection_params(&app, &saved_conn.params).await?;
-    let params = resolve_connection_params_with_id(&expanded_params, &connection_id)?;
+    let (params, drv) = connection_driver(&app, &connection_id).await?;
 
-    let query = match saved_conn.params.driver.as_str() {
+    let query = match params.driver.as_str() {
         "sqlite" => "SELECT datetime('now', 'localtime')",
         _ => "SELECT NOW()",
     };
 
-    let drv = driver_for(&saved_conn.params.driver).await?;
     let result = drv.execute_query(&params, query, Some(1), 1, None).await?;
 
     result
@@ -3645,7 +3592,7 @@ pub async fn import_connections_payload<R: Runtime>(
     // Save files
     persistence::save_connections_file(&conn_path, &current_file)?;
     let ssh_json = serde_json::to_string_pretty(&current_ssh).map_err(|e| e.to_string())?;
-    fs::write(ssh_path, ssh_json).map_err(|e| e.to_string())?;
+    persistence::write_atomic(&ssh_path, ssh_json)?;
 
     Ok(())
 }
@@ -2,7 +2,7 @@ use crate::keychain_utils;
 use once_cell::sync::Lazy;
 use serde::{Deserialize, Serialize};
 use std::fs;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 use tauri::AppHandle;
 use tauri::Manager;
 use std::sync::RwLock;
@@ -91,8 +91,15 @@ pub struct AppConfig {
     pub mcp_preflight_explain: Option<bool>,
 }
 
+/// The config as last loaded or saved, for code without an `AppHandle`
+/// (pool setup, drivers). Every load and save refreshes it.
 static CONFIG_CACHE: Lazy<RwLock<AppConfig>> = Lazy::new(|| RwLock::new(AppConfig::default()));
 
+/// Many commands read a single setting (blob limit, AI provider, plugin
+/// settings); this spares them parsing the whole file while it is unchanged.
+static CONFIG_FILE_CACHE: crate::persistence::ParsedFileCache<AppConfig> =
+    crate::persistence::ParsedFileCache::new();
+
 pub fn get_config_dir<R: tauri::Runtime>(app: &AppHandle<R>) -> Option<PathBuf> {
     app.path().app_config_dir().ok()
 }
@@ -155,22 +162,37 @@ pub fn is_connection_readonly(config: &AppConfig, connection_id: &str) -> bool {
     }
 }
 
+/// Parse the config file at `path`, or `None` when it is missing or invalid.
+fn load_config_file(path: &Path) -> Option<AppConfig> {
+    CONFIG_FILE_CACHE
+        .load(path, |content| {
+            serde_json::from_str(content).map_err(|e| e.to_string())
+        })
+        .ok()
+        .flatten()
+}
+
+/// Write `config` to `path` and refresh the in-memory copy.
+fn write_config_file(path: &Path, config: &AppConfig) -> Result<(), String> {
+    let content = serde_json::to_string_pretty(config).map_err(|e| e.to_string())?;
+    write_config_content(path, content, config)
+}
+
+/// Like `write_config_file`, for callers that already hold the text to write;
+/// `config` must be its parsed form.
+fn write_config_content(path: &Path, content: String, config: &AppConfig) -> Result<(), String> {
+    crate::persistence::write_atomic(path, content)?;
+    cache_config(config);
+    Ok(())
+}
+
 // Internal load
 pub fn load_config_internal<R: tauri::Runtime>(app: &AppHandle<R>) -> AppConfig {
-    if let Some(config_dir) = get_config_dir(app) {
-        let config_path = config_dir.join("config.json");
-        if config_path.exists() {
-            if let Ok(content) = fs::read_to_string(config_path) {
-                if let Ok(config) = serde_json::from_str(&content) {
-                    cache_config(&config);
-                    return config;
-                }
-            }
-        }
-    }
-    let default_config = AppConfig::default();
-    cache_config(&default_config);
-    default_config
+    let config = get_config_dir(app)
+        .and_then(|config_dir| load_config_file(&config_dir.join("config.json")))
+        .unwrap_or_default();
+    cache_config(&config);
+    config
 }
 
 #[tauri::command]
@@ -329,10 +351,7 @@ pub fn save_config(app: AppHandle, config: AppConfig) -> Result<(), String> {
             existing_config.mcp_preflight_explain = config.mcp_preflight_explain;
         }
 
-        let content = serde_json::to_string_pretty(&existing_config).map_err(|e| e.to_string())?;
-        fs::write(config_path, content).map_err(|e| e.to_string())?;
-        cache_config(&existing_config);
-        Ok(())
+        write_config_file(&config_path, &existing_config)
     } else {
         Err("Could not resolve config directory".to_string())
     }
@@ -359,10 +378,12 @@ pub fn set_schema_preference(
         let config_path = config_dir.join("config.json");
         let mut config = load_config_internal(&app);
         let prefs = config.schema_preferences.get_or_insert_with(HashMap::new);
+        // Re-selecting the current schema is common; skip rewriting config.json
+        if prefs.get(&connection_id) == Some(&schema) {
+            return Ok(());
+        }
         prefs.insert(connection_id, schema);
-        let content = serde_json::to_string_pretty(&config).map_err(|e| e.to_string())?;
-        fs::write(config_path, content).map_err(|e| e.to_string())?;
-        Ok(())
+        write_config_file(&config_path, &config)
     } else {
         Err("Could not resolve config directory".to_string())
     }
@@ -390,14 +411,17 @@ pub fn set_selected_schemas(
         let config_path = config_dir.join("config.json");
         let mut config = load_config_internal(&app);
         let map = config.selected_schemas.get_or_insert_with(HashMap::new);
+        // Skip rewriting config.json when the selection did not change
         if schemas.is_empty() {
-            map.remove(&connection_id);
+            if map.remove(&connection_id).is_none() {
+                return Ok(());
+            }
+        } else if map.get(&connection_id) == Some(&schemas) {
+            return Ok(());
         } else {
             map.insert(connection_id, schemas);
         }
-        let content = serde_json::to_string_pretty(&config).map_err(|e| e.to_string())?;
-        fs::write(config_path, content).map_err(|e| e.to_string())?;
-        Ok(())
+        write_config_file(&config_path, &config)
     } else {
         Err("Could not resolve config directory".to_string())
     }
@@ -635,7 +659,7 @@ pub fn relaunch_app(app: AppHandle) {
 #[tauri::command]
 pub fn save_config_json(app: AppHandle, json: String) -> Result<(), String> {
     // Validate the JSON parses as a valid AppConfig
-    serde_json::from_str::<AppConfig>(&json)
+    let config = serde_json::from_str::<AppConfig>(&json)
         .map_err(|e| format!("Invalid configuration JSON: {}", e))?;
 
     if let Some(config_dir) = get_config_dir(&app) {
@@ -646,8 +670,7 @@ pub fn save_config_json(app: AppHandle, json: String) -> Result<(), String> {
         // Re-serialize with pretty-printing for consistency
         let value: serde_json::Value = serde_json::from_str(&json).map_err(|e| e.to_string())?;
         let pretty = serde_json::to_string_pretty(&value).map_err(|e| e.to_string())?;
-        fs::write(config_path, pretty).map_err(|e| e.to_string())?;
-        Ok(())
+        write_config_content(&config_path, pretty, &config)
     } else {
         Err("Could not resolve config directory".to_string())
     }
@@ -656,6 +679,50 @@ pub fn save_config_json(app: AppHandle, json: String) -> Result<(), String> {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use tempfile::TempDir;
+
+    #[test]
+    fn load_config_file_missing_or_invalid_is_none() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("config.json");
+        assert!(load_config_file(&path).is_none());
+
+        fs::write(&path, "not json").unwrap();
+        assert!(load_config_file(&path).is_none());
+    }
+
+    #[test]
+    fn load_config_file_picks_up_same_size_rewrites() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("config.json");
+        let language = |path: &Path| load_config_file(path).unwrap().language;
+
+        fs::write(&path, r#"{"language":"en"}"#).unwrap();
+        assert_eq!(language(&path).as_deref(), Some("en"));
+        // Served from the cache while the file is unchanged
+        assert_eq!(language(&path).as_deref(), Some("en"));
+
+        // Same length, so only the contents tell the two files apart
+        fs::write(&path, r#"{"language":"it"}"#).unwrap();
+        assert_eq!(language(&path).as_deref(), Some("it"));
+    }
+
+    #[test]
+    fn write_config_content_refreshes_loaded_and_cached_config() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("config.json");
+
+        fs::write(&path, r#"{"theme":"aaaa"}"#).unwrap();
+        assert!(load_config_file(&path).is_some());
+
+        let content = r#"{"theme":"dark"}"#.to_string();
+        let config: AppConfig = serde_json::from_str(&content).unwrap();
+        write_config_content(&path, content, &config).unwrap();
+
+        let loaded = load_config_file(&path).unwrap();
+        assert_eq!(loaded.theme.as_deref(), Some("dark"));
+        assert_eq!(get_cached_config().theme.as_deref(), Some("dark"));
+    }
 
     #[test]
     fn selected_schemas_default_is_none() {
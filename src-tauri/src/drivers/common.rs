@@ -5,8 +5,8 @@ mod query;
 mod tests;
 
 pub use blob::{
-    decode_blob_wire_format, encode_blob, encode_blob_full, resolve_blob_file_ref,
-    DEFAULT_MAX_BLOB_SIZE, MAX_BLOB_PREVIEW_SIZE,
+    base64_with_prefix, decode_blob_wire_format, encode_blob, encode_blob_full,
+    resolve_blob_file_ref, DEFAULT_MAX_BLOB_SIZE, MAX_BLOB_PREVIEW_SIZE,
 };
 pub use query::{
     build_paginated_query, calculate_offset, extract_user_limit, is_explainable_query,
@@ -10,6 +10,17 @@ pub const MAX_BLOB_PREVIEW_SIZE: usize = 4096;
 /// Can be overridden via config.json with "maxBlobSize" field.
 pub const DEFAULT_MAX_BLOB_SIZE: u64 = 100 * 1024 * 1024;
 
+/// Returns `prefix` followed by the standard base64 encoding of `data`,
+/// allocated once at its final size rather than encoding into a temporary
+/// string and copying it behind the prefix.
+pub fn base64_with_prefix(prefix: &str, data: &[u8]) -> String {
+    let encoded_len = base64::encoded_len(data.len(), true).unwrap_or(0);
+    let mut out = String::with_capacity(prefix.len() + encoded_len);
+    out.push_str(prefix);
+    base64::Engine::encode_string(&base64::engine::general_purpose::STANDARD, data, &mut out);
+    out
+}
+
 /// Encodes a blob byte slice into the canonical wire format used by all drivers.
 /// Format: "BLOB:<total_size_bytes>:<mime_type>:<base64_data>"
 pub fn encode_blob(data: &[u8]) -> String {
@@ -24,9 +35,7 @@ pub fn encode_blob(data: &[u8]) -> String {
         .map(|k| k.mime_type())
         .unwrap_or("application/octet-stream");
 
-    let b64 = base64::Engine::encode(&base64::engine::general_purpose::STANDARD, preview);
-
-    format!("BLOB:{}:{}:{}", total_size, mime_type, b64)
+    base64_with_prefix(&format!("BLOB:{}:{}:", total_size, mime_type), preview)
 }
 
 /// Encodes a blob byte slice into the canonical wire format encoding ALL bytes.
@@ -40,9 +49,7 @@ pub fn encode_blob_full(data: &[u8]) -> String {
         .map(|k| k.mime_type())
         .unwrap_or("application/octet-stream");
 
-    let b64 = base64::Engine::encode(&base64::engine::general_purpose::STANDARD, data);
-
-    format!("BLOB:{}:{}:{}", total_size, mime_type, b64)
+    base64_with_prefix(&format!("BLOB:{}:{}:", total_size, mime_type), data)
 }
 
 /// Resolves a BLOB_FILE_REF to actual bytes by reading from disk.
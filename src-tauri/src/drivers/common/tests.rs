@@ -1,7 +1,7 @@
 use super::{
-    build_paginated_query, decode_blob_wire_format, encode_blob, encode_blob_full,
-    is_explainable_query, is_select_query, strip_leading_sql_comments, strip_limit_offset,
-    DEFAULT_MAX_BLOB_SIZE, MAX_BLOB_PREVIEW_SIZE,
+    base64_with_prefix, build_paginated_query, decode_blob_wire_format, encode_blob,
+    encode_blob_full, is_explainable_query, is_select_query, strip_leading_sql_comments,
+    strip_limit_offset, DEFAULT_MAX_BLOB_SIZE, MAX_BLOB_PREVIEW_SIZE,
 };
 
 #[test]
@@ -43,6 +43,26 @@ fn test_decode_blob_wire_format_composite_mime() {
     assert_eq!(decoded, svg);
 }
 
+#[test]
+fn test_base64_with_prefix_matches_separate_encoding() {
+    use base64::Engine;
+    for data in [&b""[..], b"a", b"ab", b"abc", b"hello blob"] {
+        let expected = format!(
+            "data:x;base64,{}",
+            base64::engine::general_purpose::STANDARD.encode(data)
+        );
+        assert_eq!(base64_with_prefix("data:x;base64,", data), expected);
+    }
+}
+
+#[test]
+fn test_encode_blob_full_wire_format() {
+    assert_eq!(
+        encode_blob_full(b"hello"),
+        "BLOB:5:application/octet-stream:aGVsbG8="
+    );
+}
+
 #[test]
 fn test_strip_leading_sql_comments_line() {
     assert_eq!(
@@ -3,7 +3,7 @@ use crate::commands::{
     resolve_connection_params_with_id, unregister_abort_handle, AbortHandleMap,
 };
 use crate::drivers::{mysql, postgres, sqlite};
-use crate::dump_utils::{drop_table_if_exists, format_table_ref, insert_into_statement};
+use crate::dump_utils::{drop_table_if_exists, format_table_ref, InsertBatch};
 use crate::models::ConnectionParams;
 use crate::pool_manager::{get_mysql_pool, get_postgres_pool, get_sqlite_pool};
 use futures::TryStreamExt;
@@ -70,7 +70,7 @@ pub async fn dump_database<R: Runtime>(
     // Spawn the dump process
     let task = tokio::spawn(async move {
         let file = File::create(&file_path).map_err(|e| e.to_string())?;
-        let mut writer = BufWriter::new(file);
+        let mut writer = BufWriter::with_capacity(crate::persistence::WRITE_BUFFER_SIZE, file);
 
         // Write header
         writeln!(writer, "-- Tabularis Dump").map_err(|e| e.to_string())?;
@@ -142,6 +142,9 @@ pub async fn dump_database<R: Runtime>(
     }
 }
 
+/// Rows per INSERT statement in SQL dumps
+const INSERT_BATCH_ROWS: usize = 100;
+
 async fn export_table_data(
     writer: &mut BufWriter<File>,
     params: &ConnectionParams,
@@ -165,33 +168,18 @@ async fn export_table_data(
             let pool = get_mysql_pool(params).await?;
             let mut rows = sqlx::query(&query).fetch(&pool);
 
-            let mut batch = Vec::new();
+            let mut batch = InsertBatch::new(driver, schema, table);
             while let Some(row) = rows.try_next().await.map_err(|e| e.to_string())? {
-                let mut values = Vec::new();
-                for i in 0..row.columns().len() {
-                    let val = extract_value(&row, i, None);
-                    values.push(escape_sql_value(val));
-                }
-                batch.push(format!("({})", values.join(", ")));
-
-                if batch.len() >= 100 {
-                    writeln!(
-                        writer,
-                        "{}",
-                        insert_into_statement(driver, schema, table, &batch.join(", "))
-                    )
-                    .map_err(|e| e.to_string())?;
-                    batch.clear();
+                batch.push_row(
+                    (0..row.columns().len())
+                        .map(|i| escape_sql_value(extract_value(&row, i, None))),
+                );
+
+                if batch.len() >= INSERT_BATCH_ROWS {
+                    batch.flush_to(writer).map_err(|e| e.to_string())?;
                 }
             }
-            if !batch.is_empty() {
-                writeln!(
-                    writer,
-                    "{}",
-                    insert_into_statement(driver, schema, table, &batch.join(", "))
-                )
-                .map_err(|e| e.to_string())?;
-            }
+            batch.flush_to(writer).map_err(|e| e.to_string())?;
         }
         "postgres" => {
             use crate::drivers::postgres::extract::extract_value;
@@ -205,34 +193,19 @@ async fn export_table_data(
                 .await
                 .map_err(|e| e.to_string())?);
 
-            let mut batch = Vec::new();
+            let mut batch = InsertBatch::new(driver, schema, table);
 
             while let Some(row) = rows.try_next().await.map_err(|e| e.to_string())? {
-                let mut values = Vec::new();
-                for i in 0..row.columns().len() {
-                    let val = extract_value(&row, i, None);
-                    values.push(escape_sql_value(val));
-                }
-                batch.push(format!("({})", values.join(", ")));
-
-                if batch.len() >= 100 {
-                    writeln!(
-                        writer,
-                        "{}",
-                        insert_into_statement(driver, schema, table, &batch.join(", "))
-                    )
-                    .map_err(|e| e.to_string())?;
-                    batch.clear();
+                batch.push_row(
+                    (0..row.columns().len())
+                        .map(|i| escape_sql_value(extract_value(&row, i, None))),
+                );
+
+                if batch.len() >= INSERT_BATCH_ROWS {
+                    batch.flush_to(writer).map_err(|e| e.to_string())?;
                 }
             }
-            if !batch.is_empty() {
-                writeln!(
-                    writer,
-                    "{}",
-                    insert_into_statement(driver, schema, table, &batch.join(", "))
-                )
-                .map_err(|e| e.to_string())?;
-            }
+            batch.flush_to(writer).map_err(|e| e.to_string())?;
         }
         "sqlite" => {
             use crate::drivers::sqlite::extract::extract_value;
@@ -241,33 +214,18 @@ async fn export_table_data(
             let pool = get_sqlite_pool(params).await?;
             let mut rows = sqlx::query(&query).fetch(&pool);
 
-            let mut batch = Vec::new();
+            let mut batch = InsertBatch::new(driver, schema, table);
             while let Some(row) = rows.try_next().await.map_err(|e| e.to_string())? {
-                let mut values = Vec::new();
-                for i in 0..row.columns().len() {
-                    let val = extract_value(&row, i, None);
-                    values.push(escape_sql_value(val));
-                }
-                batch.push(format!("({})", values.join(", ")));
-
-                if batch.len() >= 100 {
-                    writeln!(
-                        writer,
-                        "{}",
-                        insert_into_statement(driver, schema, table, &batch.join(", "))
-                    )
-                    .map_err(|e| e.to_string())?;
-                    batch.clear();
+                batch.push_row(
+                    (0..row.columns().len())
+                        .map(|i| escape_sql_value(extract_value(&row, i, None))),
+                );
+
+                if batch.len() >= INSERT_BATCH_ROWS {
+                    batch.flush_to(writer).map_err(|e| e.to_string())?;
                 }
             }
-            if !batch.is_empty() {
-                writeln!(
-                    writer,
-                    "{}",
-                    insert_into_statement(driver, schema, table, &batch.join(", "))
-                )
-                .map_err(|e| e.to_string())?;
-            }
+            batch.flush_to(writer).map_err(|e| e.to_string())?;
         }
         _ => return Err("Unsupported driver".into()),
     }
@@ -591,6 +549,9 @@ pub async fn import_database<R: Runtime>(
     }
 }
 
+/// Upper bound for preallocating a zipped SQL entry from its declared size
+const ZIP_PREALLOC_LIMIT: u64 = 256 * 1024 * 1024;
+
 // Creates a BufReader from the file without loading entire content into memory
 // For ZIP files, extracts to a string in memory (limitation of zip crate)
 // For regular SQL files, uses streaming with a large buffer
@@ -605,14 +566,17 @@ fn create_sql_reader(file: File, file_path: &str) -> Result<Box<dyn BufRead + Se
         for i in 0..archive.len() {
             let mut zipped_file = archive.by_index(i).map_err(|e| e.to_string())?;
             if zipped_file.name().ends_with(".sql") {
-                let mut content = String::new();
+                // Read raw bytes into a buffer sized from the entry header (capped,
+                // since the header is untrusted): no regrowth copies and no upfront
+                // UTF-8 pass, as read_line validates each line as it is consumed
+                let capacity = zipped_file.size().min(ZIP_PREALLOC_LIMIT) as usize;
+                let mut content = Vec::with_capacity(capacity);
                 zipped_file
-                    .read_to_string(&mut content)
+                    .read_to_end(&mut content)
                     .map_err(|e| e.to_string())?;
 
-                // Create a BufReader from the extracted string
-                let cursor = std::io::Cursor::new(content.into_bytes());
-                return Ok(Box::new(BufReader::new(cursor)));
+                // Cursor is already BufRead, so no extra BufReader copy is needed
+                return Ok(Box::new(std::io::Cursor::new(content)));
             }
         }
         Err("No .sql file found in zip archive".into())
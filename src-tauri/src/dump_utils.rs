@@ -1,3 +1,5 @@
+use std::io::Write;
+
 /// Returns a properly quoted, schema-qualified table identifier for SQL output.
 ///
 /// - MySQL: `table` (backtick-quoted, no schema prefix)
@@ -28,6 +30,71 @@ pub fn insert_into_statement(driver: &str, schema: &str, table: &str, values: &s
     )
 }
 
+/// Accumulates rows for a multi-row INSERT in one reusable buffer.
+///
+/// Each row is written straight into the values text, so a batch costs a
+/// single growing `String` instead of a `Vec` per row, a joined tuple per row
+/// and a joined batch per flush.
+pub struct InsertBatch {
+    driver: String,
+    schema: String,
+    table: String,
+    rows: String,
+    len: usize,
+}
+
+impl InsertBatch {
+    pub fn new(driver: &str, schema: &str, table: &str) -> Self {
+        Self {
+            driver: driver.to_string(),
+            schema: schema.to_string(),
+            table: table.to_string(),
+            rows: String::new(),
+            len: 0,
+        }
+    }
+
+    /// Appends one `(v1, v2, ...)` tuple of already escaped SQL literals.
+    pub fn push_row<I>(&mut self, values: I)
+    where
+        I: IntoIterator<Item = String>,
+    {
+        if self.len > 0 {
+            self.rows.push_str(", ");
+        }
+        self.rows.push('(');
+        for (i, value) in values.into_iter().enumerate() {
+            if i > 0 {
+                self.rows.push_str(", ");
+            }
+            self.rows.push_str(&value);
+        }
+        self.rows.push(')');
+        self.len += 1;
+    }
+
+    pub fn len(&self) -> usize {
+        self.len
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len == 0
+    }
+
+    /// Writes the pending rows as one statement line and resets the batch,
+    /// keeping the buffer's capacity for the next one. No-op when empty.
+    pub fn flush_to<W: Write>(&mut self, writer: &mut W) -> std::io::Result<()> {
+        if self.is_empty() {
+            return Ok(());
+        }
+        let statement = insert_into_statement(&self.driver, &self.schema, &self.table, &self.rows);
+        writeln!(writer, "{}", statement)?;
+        self.rows.clear();
+        self.len = 0;
+        Ok(())
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -130,4 +197,48 @@ mod tests {
             );
         }
     }
+
+    mod insert_batch_tests {
+        use super::*;
+
+        fn row(values: &[&str]) -> Vec<String> {
+            values.iter().map(|v| v.to_string()).collect()
+        }
+
+        #[test]
+        fn flush_matches_insert_into_statement() {
+            let mut batch = InsertBatch::new("postgres", "app", "orders");
+            batch.push_row(row(&["1", "100"]));
+            batch.push_row(row(&["2", "'x'"]));
+            assert_eq!(batch.len(), 2);
+
+            let mut out = Vec::new();
+            batch.flush_to(&mut out).unwrap();
+            let expected = insert_into_statement("postgres", "app", "orders", "(1, 100), (2, 'x')");
+            assert_eq!(String::from_utf8(out).unwrap(), format!("{}\n", expected));
+            assert!(batch.is_empty());
+        }
+
+        #[test]
+        fn flush_resets_between_batches() {
+            let mut batch = InsertBatch::new("mysql", "", "users");
+            let mut out = Vec::new();
+            batch.push_row(row(&["1"]));
+            batch.flush_to(&mut out).unwrap();
+            batch.push_row(row(&["2"]));
+            batch.flush_to(&mut out).unwrap();
+            assert_eq!(
+                String::from_utf8(out).unwrap(),
+                "INSERT INTO `users` VALUES (1);\nINSERT INTO `users` VALUES (2);\n"
+            );
+        }
+
+        #[test]
+        fn flush_of_empty_batch_writes_nothing() {
+            let mut batch = InsertBatch::new("sqlite", "", "t");
+            let mut out = Vec::new();
+            batch.flush_to(&mut out).unwrap();
+            assert!(out.is_empty());
+        }
+    }
 }
@@ -87,7 +87,7 @@ pub async fn export_query_to_file<R: Runtime>(
 
     let task = tokio::spawn(async move {
         let file = File::create(&file_path).map_err(|e| e.to_string())?;
-        let writer = BufWriter::new(file);
+        let writer = BufWriter::with_capacity(crate::persistence::WRITE_BUFFER_SIZE, file);
         run_export(
             app_for_task,
             &driver,
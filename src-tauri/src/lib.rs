@@ -40,6 +40,8 @@ pub mod models_tests;
 pub mod notebooks;
 pub mod paths; // Added
 pub mod persistence;
+#[cfg(test)]
+pub mod persistence_tests;
 pub mod plugins;
 pub mod pool_manager;
 #[cfg(test)]
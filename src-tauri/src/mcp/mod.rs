@@ -7,6 +7,7 @@ use crate::config::{
     DEFAULT_MCP_APPROVAL_TIMEOUT_SECONDS, DEFAULT_MCP_PREFLIGHT_EXPLAIN,
 };
 use crate::credential_cache;
+use crate::drivers::driver_trait::DatabaseDriver;
 use crate::drivers::{mysql, postgres, sqlite};
 use crate::heartbeat;
 use crate::models::{ConnectionParams, SshConnection};
@@ -207,9 +208,26 @@ async fn resolve_db_params(
     Ok((conn, db_params))
 }
 
+/// Look up the registered driver for `id`, as a JSON-RPC error if unknown.
+async fn driver_for(id: &str) -> Result<std::sync::Arc<dyn DatabaseDriver>, JsonRpcError> {
+    crate::drivers::registry::get_driver(id)
+        .await
+        .ok_or_else(|| JsonRpcError {
+            code: -32000,
+            message: format!("Unsupported driver: {}", id),
+            data: None,
+        })
+}
+
 pub async fn run_mcp_server() {
     eprintln!("[MCP] Starting Tabularis MCP Server...");
 
+    // The MCP process never runs the Tauri setup hook, so register the
+    // built-in drivers here before serving any tool call.
+    crate::drivers::registry::register_driver(mysql::MysqlDriver::new()).await;
+    crate::drivers::registry::register_driver(postgres::PostgresDriver::new()).await;
+    crate::drivers::registry::register_driver(sqlite::SqliteDriver::new()).await;
+
     let stdin = io::stdin();
     let mut stdout = io::stdout();
     let mut iterator = stdin.lock().lines();
@@ -432,17 +450,15 @@ async fn handle_read_resource(params: Option<Value>) -> Result<Value, JsonRpcErr
                 data: None,
             })?;
 
-        let tables = match conn.params.driver.as_str() {
-            "mysql" => mysql::get_tables(&params, None).await,
-            "postgres" => postgres::get_tables(&params, "public").await,
-            "sqlite" => sqlite::get_tables(&params).await,
-            _ => Err("Unsupported driver".into()),
-        }
-        .map_err(|e| JsonRpcError {
-            code: -32000,
-            message: e,
-            data: None,
-        })?;
+        let drv = driver_for(&conn.params.driver).await?;
+        let tables = drv
+            .get_tables(&params, None)
+            .await
+            .map_err(|e| JsonRpcError {
+                code: -32000,
+                message: e,
+                data: None,
+            })?;
 
         // Format as simplified DDL or JSON
         let schema_json = serde_json::to_string_pretty(&tables).unwrap();
@@ -703,20 +719,15 @@ async fn tool_list_tables(
     let (conn, db_params) = resolve_db_params(conn_id).await?;
     audit.connection_name = Some(conn.name.clone());
 
-    let tables = match conn.params.driver.as_str() {
-        "mysql" => mysql::get_tables(&db_params, schema).await,
-        "postgres" => {
-            let s = schema.unwrap_or("public");
-            postgres::get_tables(&db_params, s).await
-        }
-        "sqlite" => sqlite::get_tables(&db_params).await,
-        _ => Err("Unsupported driver".into()),
-    }
-    .map_err(|e| JsonRpcError {
-        code: -32000,
-        message: e,
-        data: None,
-    })?;
+    let drv = driver_for(&conn.params.driver).await?;
+    let tables = drv
+        .get_tables(&db_params, schema)
+        .await
+        .map_err(|e| JsonRpcError {
+            code: -32000,
+            message: e,
+            data: None,
+        })?;
 
     let names: Vec<&str> = tables.iter().map(|t| t.name.as_str()).collect();
     audit.rows = Some(names.len());
@@ -755,34 +766,10 @@ async fn tool_describe_table(
     let (conn, db_params) = resolve_db_params(conn_id).await?;
     audit.connection_name = Some(conn.name.clone());
 
-    let (columns, foreign_keys, indexes) = match conn.params.driver.as_str() {
-        "mysql" => {
-            let cols = mysql::get_columns(&db_params, table_name, schema).await;
-            let fks = mysql::get_foreign_keys(&db_params, table_name, schema).await;
-            let idxs = mysql::get_indexes(&db_params, table_name, schema).await;
-            (cols, fks, idxs)
-        }
-        "postgres" => {
-            let s = schema.unwrap_or("public");
-            let cols = postgres::get_columns(&db_params, table_name, s).await;
-            let fks = postgres::get_foreign_keys(&db_params, table_name, s).await;
-            let idxs = postgres::get_indexes(&db_params, table_name, s).await;
-            (cols, fks, idxs)
-        }
-        "sqlite" => {
-            let cols = sqlite::get_columns(&db_params, table_name).await;
-            let fks = sqlite::get_foreign_keys(&db_params, table_name).await;
-            let idxs = sqlite::get_indexes(&db_params, table_name).await;
-            (cols, fks, idxs)
-        }
-        _ => {
-            return Err(JsonRpcError {
-                code: -32000,
-                message: "Unsupported driver".to_string(),
-                data: None,
-            })
-        }
-    };
+    let drv = driver_for(&conn.params.driver).await?;
+    let columns = drv.get_columns(&db_params, table_name, schema).await;
+    let foreign_keys = drv.get_foreign_keys(&db_params, table_name, schema).await;
+    let indexes = drv.get_indexes(&db_params, table_name, schema).await;
 
     let result = json!({
         "table": table_name,
@@ -991,21 +978,15 @@ async fn tool_run_query(
         }
     }
 
-    let result = match conn.params.driver.as_str() {
-        "mysql" => {
-            mysql::execute_query(&db_params, &effective_query, Some(max_rows), 1, None).await
-        }
-        "postgres" => {
-            postgres::execute_query(&db_params, &effective_query, Some(max_rows), 1, None).await
-        }
-        "sqlite" => sqlite::execute_query(&db_params, &effective_query, Some(max_rows), 1).await,
-        _ => Err("Unsupported driver".into()),
-    }
-    .map_err(|e| JsonRpcError {
-        code: -32000,
-        message: e,
-        data: None,
-    })?;
+    let drv = driver_for(&conn.params.driver).await?;
+    let result = drv
+        .execute_query(&db_params, &effective_query, Some(max_rows), 1, None)
+        .await
+        .map_err(|e| JsonRpcError {
+            code: -32000,
+            message: e,
+            data: None,
+        })?;
 
     audit.rows = Some(result.rows.len());
 
@@ -1,23 +1,99 @@
 use crate::models::{ConnectionGroup, ConnectionsFile, SavedConnection};
+use std::collections::hash_map::DefaultHasher;
 use std::fs;
-use std::path::Path;
+use std::hash::{Hash, Hasher};
+use std::io::{self, Write};
+use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::Mutex;
+
+/// Buffer size for streamed file writes (SQL dumps, exports, query history).
+/// These are produced as many small records, and the 8 KiB `BufWriter`
+/// default would issue a write syscall every few of them.
+pub const WRITE_BUFFER_SIZE: usize = 128 * 1024;
+
+/// Parsed copy of a file that other processes may rewrite at any time (the
+/// MCP server saves connections.json, users edit config.json by hand).
+///
+/// The file is still read on every load; only parsing is skipped, and only
+/// while the bytes on disk hash to the ones the cached value came from.
+/// Modification time and size alone are not trusted: a same-size rewrite can
+/// land within one mtime tick.
+pub struct ParsedFileCache<T> {
+    entry: Mutex<Option<ParsedFile<T>>>,
+}
+
+struct ParsedFile<T> {
+    path: PathBuf,
+    len: usize,
+    hash: u64,
+    value: T,
+}
+
+impl<T: Clone> ParsedFileCache<T> {
+    pub const fn new() -> Self {
+        Self {
+            entry: Mutex::new(None),
+        }
+    }
+
+    /// Read `path` and parse it with `parse`, reusing the previous value when
+    /// the contents are unchanged. Returns `Ok(None)` when the file is missing.
+    pub fn load<F>(&self, path: &Path, parse: F) -> Result<Option<T>, String>
+    where
+        F: FnOnce(&str) -> Result<T, String>,
+    {
+        let content = match fs::read_to_string(path) {
+            Ok(content) => content,
+            Err(e) if e.kind() == io::ErrorKind::NotFound => return Ok(None),
+            Err(e) => return Err(e.to_string()),
+        };
+        let mut hasher = DefaultHasher::new();
+        content.hash(&mut hasher);
+        let hash = hasher.finish();
+
+        if let Ok(entry) = self.entry.lock() {
+            if let Some(cached) = entry.as_ref() {
+                if cached.path == path && cached.len == content.len() && cached.hash == hash {
+                    return Ok(Some(cached.value.clone()));
+                }
+            }
+        }
+
+        let value = parse(&content)?;
+        if let Ok(mut entry) = self.entry.lock() {
+            *entry = Some(ParsedFile {
+                path: path.to_path_buf(),
+                len: content.len(),
+                hash,
+                value: value.clone(),
+            });
+        }
+        Ok(Some(value))
+    }
+}
+
+/// Nearly every command resolves its connection through this file, often
+/// several at once (e.g. tables, views, routines and triggers on connect).
+static CONNECTIONS_CACHE: ParsedFileCache<ConnectionsFile> = ParsedFileCache::new();
 
 /// Load connections file (raw, no keychain reads).
 /// Supports both old format (array of connections) and new format (with groups).
 /// Use `load_connections` or `load_connections_with_passwords` when passwords are needed.
 pub fn load_connections_file(path: &Path) -> Result<ConnectionsFile, String> {
-    if !path.exists() {
-        return Ok(ConnectionsFile::default());
-    }
-    let content = fs::read_to_string(path).map_err(|e| e.to_string())?;
+    Ok(CONNECTIONS_CACHE
+        .load(path, parse_connections_file)?
+        .unwrap_or_default())
+}
 
+fn parse_connections_file(content: &str) -> Result<ConnectionsFile, String> {
     // Try parsing as the new format first
-    if let Ok(file) = serde_json::from_str::<ConnectionsFile>(&content) {
+    if let Ok(file) = serde_json::from_str::<ConnectionsFile>(content) {
         return Ok(file);
     }
 
     // Fall back to old format (array of connections)
-    let connections: Vec<SavedConnection> = serde_json::from_str(&content)
+    let connections: Vec<SavedConnection> = serde_json::from_str(content)
         .map_err(|_| "Failed to parse connections file".to_string())?;
 
     Ok(ConnectionsFile {
@@ -57,7 +133,44 @@ pub fn save_connections_file(path: &Path, file: &ConnectionsFile) -> Result<(),
     };
 
     let json = serde_json::to_string_pretty(&to_save).map_err(|e| e.to_string())?;
-    fs::write(path, json).map_err(|e| e.to_string())
+    write_atomic(path, json)
+}
+
+/// Sequence number for temp files, so concurrent writes within this process
+/// never share one.
+static TMP_SEQ: AtomicU64 = AtomicU64::new(0);
+
+/// Write `contents` to `path` through a sibling temp file that is synced to
+/// disk and then renamed over the target. An interrupted write leaves the
+/// previous file intact instead of a truncated one.
+///
+/// The temp name carries the process id and a per-process sequence number:
+/// the GUI and the MCP server may write the same file at once, and a shared
+/// temp path would let one truncate the other's half-written file.
+pub fn write_atomic(path: &Path, contents: impl AsRef<[u8]>) -> Result<(), String> {
+    let mut tmp_name = path
+        .file_name()
+        .ok_or_else(|| format!("Invalid file path: {}", path.display()))?
+        .to_os_string();
+    tmp_name.push(format!(
+        ".{}.{}.tmp",
+        std::process::id(),
+        TMP_SEQ.fetch_add(1, Ordering::Relaxed)
+    ));
+    let tmp_path = path.with_file_name(tmp_name);
+
+    let written = fs::File::create(&tmp_path).and_then(|mut file| {
+        file.write_all(contents.as_ref())?;
+        file.sync_all()
+    });
+    if let Err(e) = written {
+        let _ = fs::remove_file(&tmp_path);
+        return Err(e.to_string());
+    }
+    fs::rename(&tmp_path, path).map_err(|e| {
+        let _ = fs::remove_file(&tmp_path);
+        e.to_string()
+    })
 }
 
 /// Legacy function for backward compatibility - saves using new format
@@ -0,0 +1,151 @@
+#[cfg(test)]
+mod tests {
+    use crate::models::{ConnectionGroup, ConnectionsFile};
+    use crate::persistence::{
+        load_connections_file, save_connections_file, write_atomic, ParsedFileCache,
+    };
+    use std::fs;
+    use tempfile::TempDir;
+
+    #[test]
+    fn write_atomic_creates_and_replaces_file() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("connections.json");
+
+        write_atomic(&path, "first").unwrap();
+        assert_eq!(fs::read_to_string(&path).unwrap(), "first");
+
+        write_atomic(&path, "second").unwrap();
+        assert_eq!(fs::read_to_string(&path).unwrap(), "second");
+    }
+
+    #[test]
+    fn write_atomic_leaves_no_temp_file() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("connections.json");
+
+        write_atomic(&path, "{}").unwrap();
+
+        let names: Vec<_> = fs::read_dir(tmp.path())
+            .unwrap()
+            .map(|e| e.unwrap().file_name().into_string().unwrap())
+            .collect();
+        assert_eq!(names, vec!["connections.json".to_string()]);
+    }
+
+    #[test]
+    fn write_atomic_concurrent_writers_do_not_collide() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("connections.json");
+
+        let writers: Vec<_> = (0..8)
+            .map(|i| {
+                let path = path.clone();
+                std::thread::spawn(move || write_atomic(&path, i.to_string().repeat(4096)))
+            })
+            .collect();
+        for writer in writers {
+            writer.join().unwrap().unwrap();
+        }
+
+        let content = fs::read_to_string(&path).unwrap();
+        assert_eq!(content.len(), 4096);
+        let first = content.as_bytes()[0];
+        assert!(content.bytes().all(|b| b == first));
+        assert_eq!(fs::read_dir(tmp.path()).unwrap().count(), 1);
+    }
+
+    #[test]
+    fn write_atomic_fails_for_missing_directory() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("missing").join("connections.json");
+        assert!(write_atomic(&path, "{}").is_err());
+        assert!(!path.exists());
+    }
+
+    #[test]
+    fn save_then_load_round_trips_groups() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("nested").join("connections.json");
+        let file = ConnectionsFile {
+            groups: vec![ConnectionGroup {
+                id: "g1".into(),
+                name: "Production".into(),
+                collapsed: true,
+                sort_order: 2,
+            }],
+            connections: Vec::new(),
+        };
+
+        save_connections_file(&path, &file).unwrap();
+        let loaded = load_connections_file(&path).unwrap();
+
+        assert_eq!(loaded.groups.len(), 1);
+        assert_eq!(loaded.groups[0].id, "g1");
+        assert!(loaded.groups[0].collapsed);
+        assert!(loaded.connections.is_empty());
+    }
+
+    fn file_with_group(id: &str) -> ConnectionsFile {
+        ConnectionsFile {
+            groups: vec![ConnectionGroup {
+                id: id.into(),
+                name: id.into(),
+                collapsed: false,
+                sort_order: 0,
+            }],
+            connections: Vec::new(),
+        }
+    }
+
+    #[test]
+    fn load_sees_saves_made_after_a_cached_load() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("connections.json");
+
+        save_connections_file(&path, &file_with_group("first")).unwrap();
+        assert_eq!(load_connections_file(&path).unwrap().groups[0].id, "first");
+
+        save_connections_file(&path, &file_with_group("second")).unwrap();
+        assert_eq!(load_connections_file(&path).unwrap().groups[0].id, "second");
+    }
+
+    #[test]
+    fn load_sees_external_rewrites() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("connections.json");
+
+        save_connections_file(&path, &file_with_group("app")).unwrap();
+        assert_eq!(load_connections_file(&path).unwrap().groups[0].id, "app");
+
+        fs::write(&path, r#"{"groups":[],"connections":[]}"#).unwrap();
+        assert!(load_connections_file(&path).unwrap().groups.is_empty());
+
+        fs::remove_file(&path).unwrap();
+        assert!(load_connections_file(&path).unwrap().groups.is_empty());
+    }
+
+    #[test]
+    fn load_sees_same_size_external_rewrites() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("connections.json");
+
+        save_connections_file(&path, &file_with_group("prod1")).unwrap();
+        let before = fs::metadata(&path).unwrap();
+        assert_eq!(load_connections_file(&path).unwrap().groups[0].id, "prod1");
+
+        // Same length and, on coarse-mtime filesystems, the same mtime.
+        let content = fs::read_to_string(&path).unwrap().replace("prod1", "prod2");
+        fs::write(&path, content).unwrap();
+        assert_eq!(fs::metadata(&path).unwrap().len(), before.len());
+        assert_eq!(load_connections_file(&path).unwrap().groups[0].id, "prod2");
+    }
+
+    #[test]
+    fn parsed_file_cache_reports_missing_file() {
+        let tmp = TempDir::new().unwrap();
+        let cache = ParsedFileCache::<String>::new();
+        let path = tmp.path().join("missing.json");
+        assert_eq!(cache.load(&path, |c| Ok(c.to_string())).unwrap(), None);
+    }
+}
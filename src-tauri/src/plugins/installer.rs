@@ -1,5 +1,4 @@
 use std::fs;
-use std::io::Read;
 use std::path::{Path, PathBuf};
 
 use directories::ProjectDirs;
@@ -151,10 +150,11 @@ pub async fn download_and_install(plugin_id: &str, download_url: &str) -> Result
                         .map_err(|e| format!("Failed to create parent directory: {}", e))?;
                 }
             }
-            let mut buf = Vec::new();
-            file.read_to_end(&mut buf)
-                .map_err(|e| format!("Failed to read ZIP file content: {}", e))?;
-            fs::write(&out_path, &buf).map_err(|e| format!("Failed to write file: {}", e))?;
+            // Stream the entry to disk instead of buffering it whole first.
+            let mut out_file =
+                fs::File::create(&out_path).map_err(|e| format!("Failed to write file: {}", e))?;
+            std::io::copy(&mut file, &mut out_file)
+                .map_err(|e| format!("Failed to extract ZIP file content: {}", e))?;
 
             // Set executable permissions on Unix
             #[cfg(unix)]
@@ -1,7 +1,7 @@
 use crate::config::load_config_internal;
 use serde::{Deserialize, Serialize};
 use std::fs;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 use tauri::{AppHandle, Manager, Runtime};
 use uuid::Uuid;
 
@@ -38,26 +38,19 @@ fn get_history_path<R: Runtime>(
     Ok(dir.join(format!("{}.json", connection_id)))
 }
 
-fn read_history<R: Runtime>(
-    app: &AppHandle<R>,
-    connection_id: &str,
-) -> Result<Vec<QueryHistoryEntry>, String> {
-    let path = get_history_path(app, connection_id)?;
+pub(crate) fn read_history(path: &Path) -> Result<Vec<QueryHistoryEntry>, String> {
     if !path.exists() {
         return Ok(Vec::new());
     }
-    let content = fs::read_to_string(&path).map_err(|e| e.to_string())?;
+    let content = fs::read_to_string(path).map_err(|e| e.to_string())?;
     serde_json::from_str(&content).map_err(|e| e.to_string())
 }
 
-fn write_history<R: Runtime>(
-    app: &AppHandle<R>,
-    connection_id: &str,
-    entries: &[QueryHistoryEntry],
-) -> Result<(), String> {
-    let path = get_history_path(app, connection_id)?;
-    let content = serde_json::to_string_pretty(entries).map_err(|e| e.to_string())?;
-    fs::write(path, content).map_err(|e| e.to_string())
+/// Serialize into a presized buffer and replace the file atomically, so a
+/// crash mid-write never leaves a truncated history behind.
+pub(crate) fn write_history(path: &Path, entries: &[QueryHistoryEntry]) -> Result<(), String> {
+    let content = serde_json::to_vec_pretty(entries).map_err(|e| e.to_string())?;
+    crate::persistence::write_atomic(path, content)
 }
 
 #[tauri::command]
@@ -65,7 +58,7 @@ pub async fn get_query_history<R: Runtime>(
     app: AppHandle<R>,
     connection_id: String,
 ) -> Result<Vec<QueryHistoryEntry>, String> {
-    read_history(&app, &connection_id)
+    read_history(&get_history_path(&app, &connection_id)?)
 }
 
 #[tauri::command]
@@ -80,7 +73,9 @@ pub async fn add_query_history_entry<R: Runtime>(
     error: Option<String>,
     database: Option<String>,
 ) -> Result<QueryHistoryEntry, String> {
-    let mut entries = read_history(&app, &connection_id)?;
+    // Resolve the path once; the file is read and rewritten in place below.
+    let path = get_history_path(&app, &connection_id)?;
+    let mut entries = read_history(&path)?;
 
     let config = load_config_internal(&app);
     let max_entries = config
@@ -96,7 +91,7 @@ pub async fn add_query_history_entry<R: Runtime>(
             first.rows_affected = rows_affected;
             first.error = error.clone();
             let updated = first.clone();
-            write_history(&app, &connection_id, &entries)?;
+            write_history(&path, &entries)?;
             return Ok(updated);
         }
     }
@@ -120,7 +115,7 @@ pub async fn add_query_history_entry<R: Runtime>(
         entries.truncate(max_entries);
     }
 
-    write_history(&app, &connection_id, &entries)?;
+    write_history(&path, &entries)?;
     Ok(entry)
 }
 
@@ -130,7 +125,8 @@ pub async fn delete_query_history_entry<R: Runtime>(
     connection_id: String,
     id: String,
 ) -> Result<(), String> {
-    let mut entries = read_history(&app, &connection_id)?;
+    let path = get_history_path(&app, &connection_id)?;
+    let mut entries = read_history(&path)?;
     let original_len = entries.len();
     entries.retain(|e| e.id != id);
 
@@ -138,7 +134,7 @@ pub async fn delete_query_history_entry<R: Runtime>(
         return Err("History entry not found".to_string());
     }
 
-    write_history(&app, &connection_id, &entries)
+    write_history(&path, &entries)
 }
 
 #[tauri::command]
@@ -174,10 +170,11 @@ pub fn backfill_missing_database_for_connection<R: Runtime>(
     connection_id: &str,
     database: &str,
 ) -> Result<usize, String> {
-    let mut entries = read_history(app, connection_id)?;
+    let path = get_history_path(app, connection_id)?;
+    let mut entries = read_history(&path)?;
     let updated = backfill_missing_database(&mut entries, database);
     if updated > 0 {
-        write_history(app, connection_id, &entries)?;
+        write_history(&path, &entries)?;
     }
     Ok(updated)
 }
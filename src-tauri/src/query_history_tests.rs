@@ -1,6 +1,9 @@
 #[cfg(test)]
 mod tests {
-    use crate::query_history::{backfill_missing_database, QueryHistoryEntry};
+    use crate::query_history::{
+        backfill_missing_database, read_history, write_history, QueryHistoryEntry,
+    };
+    use tempfile::TempDir;
 
     fn make_entry(id: &str, database: Option<&str>) -> QueryHistoryEntry {
         QueryHistoryEntry {
@@ -53,4 +56,27 @@ mod tests {
         assert_eq!(updated, 0);
         assert_eq!(entries[0].database.as_deref(), Some(""));
     }
+
+    #[test]
+    fn missing_history_file_reads_as_empty() {
+        let tmp = TempDir::new().unwrap();
+        let entries = read_history(&tmp.path().join("conn.json")).unwrap();
+        assert!(entries.is_empty());
+    }
+
+    #[test]
+    fn write_then_read_round_trips_pretty_json() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("conn.json");
+        let entries = vec![make_entry("1", Some("app")), make_entry("2", None)];
+
+        write_history(&path, &entries).unwrap();
+
+        let on_disk = std::fs::read_to_string(&path).unwrap();
+        assert_eq!(on_disk, serde_json::to_string_pretty(&entries).unwrap());
+        let read_back = read_history(&path).unwrap();
+        assert_eq!(read_back.len(), 2);
+        assert_eq!(read_back[0].id, "1");
+        assert_eq!(read_back[1].database, None);
+    }
 }
@@ -51,8 +51,8 @@ export const ViewEditorModal = ({
       });
       // Extract just the SELECT part for editing
       let selectPart = def;
-      if (def.toUpperCase().includes(" AS ")) {
-        const asIndex = def.toUpperCase().indexOf(" AS ");
+      const asIndex = def.toUpperCase().indexOf(" AS ");
+      if (asIndex !== -1) {
         selectPart = def.substring(asIndex + 4).trim();
       }
       setDefinition(selectPart);
@@ -120,18 +120,11 @@ export function AiTab() {
 
   const checkKeys = useCallback(async () => {
     try {
-      const openai = await invoke<AiKeyStatus>("check_ai_key_status", {
-        provider: "openai",
-      });
-      const anthropic = await invoke<AiKeyStatus>("check_ai_key_status", {
-        provider: "anthropic",
-      });
-      const openrouter = await invoke<AiKeyStatus>("check_ai_key_status", {
-        provider: "openrouter",
-      });
-      const customOpenai = await invoke<AiKeyStatus>("check_ai_key_status", {
-        provider: "custom-openai",
-      });
+      const [openai, anthropic, openrouter, customOpenai] = await Promise.all(
+        ["openai", "anthropic", "openrouter", "custom-openai"].map((provider) =>
+          invoke<AiKeyStatus>("check_ai_key_status", { provider }),
+        ),
+      );
       const ollama = { configured: true, fromEnv: false };
       setAiKeyStatus({
         openai,
@@ -12,6 +12,7 @@ import {
 import clsx from "clsx";
 import { useSettings } from "../../hooks/useSettings";
 import { useAlert } from "../../hooks/useAlert";
+import { splitQuery } from "../../utils/logs";
 import {
   SettingSection,
   SettingRow,
@@ -144,12 +145,6 @@ export function LogsTab() {
     });
   };
 
-  const hasQuery = (msg: string) => msg.includes("| Query:");
-  const extractQuery = (msg: string) => {
-    const m = msg.match(/\| Query:\s*([\s\S]*)$/);
-    return m ? m[1].trim() : msg;
-  };
-
   return (
     <div>
       {/* Settings */}
@@ -250,14 +245,11 @@ export function LogsTab() {
                 <tbody className="divide-y divide-default">
                   {logs.map((log, i) => {
                     const isExpanded = expandedLogs.has(i);
-                    const logHasQuery = hasQuery(log.message);
-                    const queryContent = logHasQuery
-                      ? extractQuery(log.message)
-                      : log.message;
-                    const previewMessage = logHasQuery
-                      ? log.message
-                          .substring(0, log.message.indexOf("| Query:"))
-                          .trim() || "Executing query"
+                    const split = splitQuery(log.message);
+                    const logHasQuery = split !== null;
+                    const queryContent = split ? split.query : log.message;
+                    const previewMessage = split
+                      ? split.preview || "Executing query"
                       : log.message;
 
                     return (
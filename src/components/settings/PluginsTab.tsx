@@ -524,6 +524,10 @@ export function PluginsTab({
       installedPlugins.map((plugin) => plugin.id),
     [settings.activeExternalDrivers, installedPlugins],
   );
+  const activeExternalDriverSet = useMemo(
+    () => new Set(activeExternalDrivers),
+    [activeExternalDrivers],
+  );
   const externalDrivers = useMemo(
     () => allDrivers.filter((driver) => driver.is_builtin !== true),
     [allDrivers],
@@ -889,7 +893,7 @@ export function PluginsTab({
                         (p) => p.id === driver.id,
                       );
                       const isEnabled =
-                        isBuiltin || activeExternalDrivers.includes(driver.id);
+                        isBuiltin || activeExternalDriverSet.has(driver.id);
                       const accent: CardAccent = isBuiltin
                         ? null
                         : isEnabled
@@ -182,6 +182,10 @@ export const SettingsProvider = ({ children }: { children: ReactNode }) => {
     let persistPromise = Promise.resolve();
 
     setSettings((prev) => {
+      // Unchanged value: keep the same state object (no re-render) and skip
+      // rewriting config.json
+      if (Object.is(prev[key], value)) return prev;
+
       const newSettings = { ...prev, [key]: value };
 
       // Persist to backend
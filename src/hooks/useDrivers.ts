@@ -157,9 +157,9 @@ export function useDrivers(): {
     load();
   }, [load]);
 
-  const activeExt = settings.activeExternalDrivers || [];
+  const activeExt = new Set(settings.activeExternalDrivers || []);
   const active = allDrivers.filter(
-    (d) => d.is_builtin === true || activeExt.includes(d.id),
+    (d) => d.is_builtin === true || activeExt.has(d.id),
   );
 
   return { drivers: active, allDrivers, installedPlugins, loading, error, refresh };
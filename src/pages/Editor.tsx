@@ -693,7 +693,7 @@ export const Editor = () => {
 
         // If not a table tab, try to extract table name from the query
         if (!tableName && textToRun) {
-          const extracted = extractTableName(textToRun);
+          const extracted = extractTableName(textToRun, activeDriver);
           // Reject views — they may not be updatable
           if (extracted && !views.some((v) => v.name === extracted)) {
             tableName = extracted;
@@ -896,7 +896,7 @@ export const Editor = () => {
           };
         }
         const res = item?.result ?? null;
-        const tableName = extractTableName(entry.query) ?? null;
+        const tableName = extractTableName(entry.query, activeDriver) ?? null;
         if (shouldRecordHistory) {
           addHistoryEntry(
             entry.query,
@@ -918,7 +918,7 @@ export const Editor = () => {
 
       updateTab(targetTabId, { results: liveResults, isLoading: false });
     },
-    [activeConnectionId, updateTab, settings.resultPageSize, activeSchema, t, isMultiDb, activeDatabaseName, addHistoryEntry],
+    [activeConnectionId, updateTab, settings.resultPageSize, activeSchema, t, isMultiDb, activeDatabaseName, addHistoryEntry, activeDriver],
   );
 
   const runResultEntryPage = useCallback(
@@ -106,11 +106,12 @@ export const Settings = () => {
   );
 
   const pluginSettingItems = new Map<string, { id: string; name: string }>();
+  const activeExternalDriverSet = new Set(activeExternalDrivers);
 
   for (const driver of allDrivers) {
     const hasSettings = (driver.settings?.length ?? 0) > 0;
     if (driver.is_builtin && !hasSettings) continue;
-    if (!driver.is_builtin && !activeExternalDrivers.includes(driver.id))
+    if (!driver.is_builtin && !activeExternalDriverSet.has(driver.id))
       continue;
     pluginSettingItems.set(driver.id, {
       id: driver.id,
@@ -120,7 +121,7 @@ export const Settings = () => {
 
   for (const plugin of installedPlugins) {
     if (pluginSidebarOverrides[plugin.id] === null) continue;
-    if (!activeExternalDrivers.includes(plugin.id)) continue;
+    if (!activeExternalDriverSet.has(plugin.id)) continue;
     pluginSettingItems.set(plugin.id, {
       id: plugin.id,
       name: plugin.name,
@@ -131,7 +132,7 @@ export const Settings = () => {
     if (
       pluginName !== null &&
       !installedPlugins.some((plugin) => plugin.id === pluginId) &&
-      activeExternalDrivers.includes(pluginId)
+      activeExternalDriverSet.has(pluginId)
     ) {
       pluginSettingItems.set(pluginId, {
         id: pluginId,
@@ -115,6 +115,15 @@ export function formatDurationMs(ms: number): string {
   return `${minutes}m ${seconds}s`;
 }
 
+// Renders an ISO timestamp as "YYYY-MM-DD HH:MM:SS". The only "T" is the
+// date/time separator, so splice around it instead of replacing and slicing.
+export function formatActivityTimestamp(iso: string): string {
+  const sep = iso.indexOf("T");
+  // A separator past the 19th character would be cut off anyway
+  if (sep === -1 || sep >= 19) return iso.slice(0, 19);
+  return `${iso.slice(0, sep)} ${iso.slice(sep + 1, 19)}`;
+}
+
 export function eventsToCsvLines(events: AiActivityEvent[]): string[] {
   const header = [
     "id",
@@ -229,6 +238,11 @@ export function parseVisualExplainDeepLink(search: string): {
   return { connectionId, query };
 }
 
+// base64 <-> base64url character swaps, applied in a single replace pass.
+// Padding only ever appears at the end, so "=" is simply dropped.
+const TO_BASE64URL: Record<string, string> = { "+": "-", "/": "_", "=": "" };
+const FROM_BASE64URL: Record<string, string> = { "-": "+", _: "/" };
+
 function base64UrlEncode(s: string): string {
   const bytes =
     typeof TextEncoder !== "undefined"
@@ -238,13 +252,12 @@ function base64UrlEncode(s: string): string {
   bytes.forEach((b) => {
     binary += String.fromCharCode(b);
   });
-  return btoa(binary).replace(/\+/g, "-").replace(/\//g, "_").replace(/=+$/, "");
+  return btoa(binary).replace(/[+/=]/g, (ch) => TO_BASE64URL[ch]);
 }
 
 function base64UrlDecode(s: string): string {
-  let padded = s.replace(/-/g, "+").replace(/_/g, "/");
-  while (padded.length % 4 !== 0) padded += "=";
-  const binary = atob(padded);
+  const base64 = s.replace(/[-_]/g, (ch) => FROM_BASE64URL[ch]);
+  const binary = atob(base64 + "=".repeat((4 - (base64.length % 4)) % 4));
   const bytes = Uint8Array.from(binary, (c) => c.charCodeAt(0));
   return typeof TextDecoder !== "undefined"
     ? new TextDecoder().decode(bytes)
@@ -12,11 +12,13 @@ export interface ChangelogEntry {
  * e.g. "**notebook:** add AI buttons ([d0ccee9](…))" → "add AI buttons"
  */
 function cleanLine(raw: string): string {
+  // Trim once up front: the patterns below consume their own surrounding
+  // whitespace, so re-trimming after each step would be a no-op pass.
   let line = raw.replace(/^\*\s*/, "").trim();
   // Remove trailing commit link: ([hash](url))
-  line = line.replace(/\s*\(\[[a-f0-9]+\]\([^)]+\)\)\s*$/, "").trim();
+  line = line.replace(/\s*\(\[[a-f0-9]+\]\([^)]+\)\)\s*$/, "");
   // Remove scope prefix: **scope:** (colon is inside the bold markers)
-  line = line.replace(/^\*\*[^*]+:\*\*\s*/, "").trim();
+  line = line.replace(/^\*\*[^*]+:\*\*\s*/, "");
   // Remove any remaining inline markdown: `code`
   line = line.replace(/`([^`]+)`/g, "$1");
   // Capitalize first letter
@@ -1,4 +1,5 @@
 import { formatCellValue } from './dataGrid';
+import { quoteStringLiteral } from './identifiers';
 
 export function rowToCSV(row: unknown[], nullLabel: string = "null", delimiter: string = ","): string {
   return row
@@ -45,7 +46,7 @@ function sqlValue(cell: unknown): string {
   if (typeof cell === "boolean") return cell ? "TRUE" : "FALSE";
   if (typeof cell === "number") return String(cell);
   const str = typeof cell === "object" ? JSON.stringify(cell) : String(cell);
-  return `'${str.replace(/'/g, "''")}'`;
+  return quoteStringLiteral(str);
 }
 
 function rowToSqlInsert(
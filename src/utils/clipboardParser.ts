@@ -32,6 +32,9 @@ export interface ParsedClipboardData {
   warnings: string[];
 }
 
+// Markdown header/body separator row, e.g. `| --- | :-: |`.
+const MARKDOWN_SEPARATOR_RE = /^\s*\|[\s\-:|]+\|\s*$/;
+
 function detectFormat(text: string): ClipboardFormat {
   const trimmed = text.trim();
   if (trimmed.startsWith('[') || trimmed.startsWith('{')) {
@@ -41,7 +44,7 @@ function detectFormat(text: string): ClipboardFormat {
   if (
     lines.length >= 2 &&
     lines[0].includes('|') &&
-    lines[1].match(/^\s*\|[\s\-:|]+\|\s*$/)
+    MARKDOWN_SEPARATOR_RE.test(lines[1])
   ) {
     return 'markdown-table';
   }
@@ -57,33 +60,50 @@ function parseTsv(text: string): string[][] {
     .map((line) => line.split('\t').map((c) => c.trim()));
 }
 
+// Picks ';' when the first line has more semicolons than commas. Walks only
+// that line, once, instead of splitting the whole paste to read it.
+function detectCsvSeparator(text: string): ';' | ',' {
+  const end = text.indexOf('\n');
+  const stop = end === -1 ? text.length : end;
+  let semicolons = 0;
+  let commas = 0;
+  for (let i = 0; i < stop; i++) {
+    const ch = text[i];
+    if (ch === ';') semicolons++;
+    else if (ch === ',') commas++;
+  }
+  return semicolons > commas ? ';' : ',';
+}
+
 function parseCsv(text: string): string[][] {
-  const firstLine = text.split('\n')[0] ?? '';
-  const separator =
-    (firstLine.match(/;/g)?.length ?? 0) > (firstLine.match(/,/g)?.length ?? 0)
-      ? ';'
-      : ',';
+  const separator = detectCsvSeparator(text);
 
   return text
     .trim()
     .split('\n')
     .map((line) => {
+      // Collect runs of plain characters as slices and join them per cell,
+      // instead of growing the cell one character at a time.
       const cells: string[] = [];
-      let current = '';
+      let parts: string[] = [];
+      let start = 0;
       let inQuotes = false;
       for (let i = 0; i < line.length; i++) {
         const ch = line[i];
         if (ch === '"') {
-          if (inQuotes && line[i + 1] === '"') { current += '"'; i++; }
+          parts.push(line.slice(start, i));
+          if (inQuotes && line[i + 1] === '"') { parts.push('"'); i++; }
           else inQuotes = !inQuotes;
+          start = i + 1;
         } else if (ch === separator && !inQuotes) {
-          cells.push(current.trim());
-          current = '';
-        } else {
-          current += ch;
+          parts.push(line.slice(start, i));
+          cells.push(parts.join('').trim());
+          parts = [];
+          start = i + 1;
         }
       }
-      cells.push(current.trim());
+      parts.push(line.slice(start));
+      cells.push(parts.join('').trim());
       return cells;
     });
 }
@@ -113,7 +133,7 @@ function parseMarkdown(text: string): string[][] {
     .trim()
     .split('\n')
     .filter((l) => l.trim().startsWith('|'))
-    .filter((l) => !l.match(/^\s*\|[\s\-:|]+\|\s*$/))
+    .filter((l) => !MARKDOWN_SEPARATOR_RE.test(l))
     .map((l) =>
       l
         .split('|')
@@ -83,6 +83,28 @@ export function formatCellValue(
   return String(value);
 }
 
+// Compiled sort-clause patterns keyed by lowercased column name. Every header
+// cell asks for its sort state on each render, so the RegExps are built once
+// per column instead of twice per call.
+const MAX_SORT_PATTERN_ENTRIES = 500;
+const sortPatternCache = new Map<string, [RegExp, RegExp]>();
+
+function getSortPatterns(normalizedCol: string): [RegExp, RegExp] {
+  let patterns = sortPatternCache.get(normalizedCol);
+  if (!patterns) {
+    const escaped = escapeRegExp(normalizedCol);
+    patterns = [
+      new RegExp(`\\b${escaped}\\s+(asc|desc)\\b`),
+      new RegExp(`\\b${escaped}\\b`),
+    ];
+    if (sortPatternCache.size >= MAX_SORT_PATTERN_ENTRIES) {
+      sortPatternCache.clear();
+    }
+    sortPatternCache.set(normalizedCol, patterns);
+  }
+  return patterns;
+}
+
 /**
  * Determines the sort state for a column based on the current sort clause
  * @param columnName - The column to check
@@ -101,10 +123,7 @@ export function getColumnSortState(
 
   // Check if column appears in sort clause
   // Handle patterns like: "name ASC", "name asc", "table.name ASC", etc.
-  const patterns = [
-    new RegExp(`\\b${escapeRegExp(normalizedCol)}\\s+(asc|desc)\\b`),
-    new RegExp(`\\b${escapeRegExp(normalizedCol)}\\b`),
-  ];
+  const patterns = getSortPatterns(normalizedCol);
 
   for (const pattern of patterns) {
     const match = normalizedClause.match(pattern);
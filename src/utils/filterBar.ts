@@ -1,4 +1,5 @@
 import type { TableColumn } from "../types/editor";
+import { quoteStringLiteral } from "./identifiers";
 
 export type FilterOperator =
   | "="
@@ -189,8 +190,7 @@ function quoteIfNeeded(value: string): string {
   ) {
     return value;
   }
-  // Escape single quotes inside the value
-  return `'${value.replace(/'/g, "''")}'`;
+  return quoteStringLiteral(value);
 }
 
 /**
@@ -1,5 +1,5 @@
 import type { ForeignKey } from "../types/schema";
-import { quoteIdentifier } from "./identifiers";
+import { quoteIdentifier, quoteStringLiteral } from "./identifiers";
 
 const NUMERIC_TYPE_KEYWORDS = [
   "int",
@@ -89,5 +89,5 @@ function formatSqlValueForFilter(value: unknown, columnType?: string): string {
   if (isNumericColumnType(columnType) && /^-?\d+(\.\d+)?$/.test(str)) {
     return str;
   }
-  return `'${str.replace(/'/g, "''")}'`;
+  return quoteStringLiteral(str);
 }
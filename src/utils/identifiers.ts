@@ -34,6 +34,7 @@ export function quoteIdentifier(
   driver: string | null | undefined,
 ): string {
   const quote = getQuoteChar(driver);
+  if (!identifier.includes(quote)) return `${quote}${identifier}${quote}`;
   const escaped =
     quote === "`"
       ? identifier.replace(/`/g, "``")
@@ -41,6 +42,17 @@ export function quoteIdentifier(
   return `${quote}${escaped}${quote}`;
 }
 
+/**
+ * Quotes a value as a SQL string literal, doubling any embedded single quotes.
+ *
+ * @example
+ * quoteStringLiteral("O'Reilly") // returns: 'O''Reilly'
+ */
+export function quoteStringLiteral(value: string): string {
+  const escaped = value.includes("'") ? value.replace(/'/g, "''") : value;
+  return `'${escaped}'`;
+}
+
 /**
  * Returns a schema-qualified, quoted table reference for use in SQL queries.
  * When a schema is provided, returns "schema"."table" (or `schema`.`table` for MySQL).
@@ -0,0 +1,25 @@
+/**
+ * Separator the backend logs between the message and the executed SQL
+ * (e.g. "Executing query on connection: abc | Query: SELECT 1")
+ */
+export const QUERY_MARKER = "| Query:";
+
+export interface LogQuerySplit {
+  preview: string;
+  query: string;
+}
+
+/**
+ * Splits a log message around the first query marker
+ * @param message - The raw log message
+ * @returns The trimmed text before and after the marker, or null if the
+ * message does not carry a query
+ */
+export function splitQuery(message: string): LogQuerySplit | null {
+  const idx = message.indexOf(QUERY_MARKER);
+  if (idx === -1) return null;
+  return {
+    preview: message.slice(0, idx).trim(),
+    query: message.slice(idx + QUERY_MARKER.length).trim(),
+  };
+}
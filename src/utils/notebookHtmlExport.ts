@@ -1,75 +1,106 @@
 import type { NotebookCell } from "../types/notebook";
 
+const HTML_ESCAPES: Record<string, string> = {
+  "&": "&amp;",
+  "<": "&lt;",
+  ">": "&gt;",
+  '"': "&quot;",
+};
+
+const HTML_ESCAPE_PATTERN = /[&<>"]/g;
+const HEADING_PATTERN = /^(#{1,3}) (.+)$/gm;
+// Matches either the opening "<p>" before a block element or the closing
+// "</p>" after one, so both unwraps happen in the same scan.
+const BLOCK_PARAGRAPH_PATTERN =
+  /<p><(h[1-3]|ul|hr|blockquote)|<\/(h[1-3]|ul|hr|blockquote)><\/p>/g;
+
+// Single pass over the text instead of one full scan per escaped character.
 function escapeHtml(text: string): string {
-  return text
-    .replace(/&/g, "&amp;")
-    .replace(/</g, "&lt;")
-    .replace(/>/g, "&gt;")
-    .replace(/"/g, "&quot;");
+  return text.replace(HTML_ESCAPE_PATTERN, (ch) => HTML_ESCAPES[ch]);
 }
 
 function renderMarkdownCell(content: string): string {
-  // Basic markdown to HTML: headings, bold, italic, code, lists
+  // Basic markdown to HTML: headings, bold, italic, code, lists.
+  // Each rule is skipped when its marker does not occur at all, so plain
+  // prose is not rescanned by every pattern.
   let html = escapeHtml(content);
 
-  // Headings
-  html = html.replace(/^### (.+)$/gm, "<h3>$1</h3>");
-  html = html.replace(/^## (.+)$/gm, "<h2>$1</h2>");
-  html = html.replace(/^# (.+)$/gm, "<h1>$1</h1>");
+  // Headings (one pass; the number of leading hashes picks the level)
+  if (html.includes("# ")) {
+    html = html.replace(
+      HEADING_PATTERN,
+      (_, hashes: string, text: string) =>
+        `<h${hashes.length}>${text}</h${hashes.length}>`,
+    );
+  }
 
   // Bold and italic
-  html = html.replace(/\*\*(.+?)\*\*/g, "<strong>$1</strong>");
-  html = html.replace(/\*(.+?)\*/g, "<em>$1</em>");
+  if (html.includes("*")) {
+    html = html.replace(/\*\*(.+?)\*\*/g, "<strong>$1</strong>");
+    html = html.replace(/\*(.+?)\*/g, "<em>$1</em>");
+  }
 
   // Inline code
-  html = html.replace(/`([^`]+)`/g, "<code>$1</code>");
+  if (html.includes("`")) {
+    html = html.replace(/`([^`]+)`/g, "<code>$1</code>");
+  }
 
   // Blockquotes
-  html = html.replace(/^&gt; (.+)$/gm, "<blockquote>$1</blockquote>");
+  if (html.includes("&gt; ")) {
+    html = html.replace(/^&gt; (.+)$/gm, "<blockquote>$1</blockquote>");
+  }
 
   // Unordered lists
-  html = html.replace(/^- (.+)$/gm, "<li>$1</li>");
-  html = html.replace(/((?:<li>.+<\/li>\n?)+)/g, "<ul>$1</ul>");
+  if (html.includes("- ")) {
+    html = html.replace(/^- (.+)$/gm, "<li>$1</li>");
+    html = html.replace(/((?:<li>.+<\/li>\n?)+)/g, "<ul>$1</ul>");
+  }
 
   // Horizontal rules
-  html = html.replace(/^---$/gm, "<hr>");
+  if (html.includes("---")) {
+    html = html.replace(/^---$/gm, "<hr>");
+  }
 
   // Line breaks for remaining text
   html = html.replace(/\n\n/g, "</p><p>");
   html = `<p>${html}</p>`;
-  html = html.replace(/<p><(h[1-3]|ul|hr|blockquote)/g, "<$1");
-  html = html.replace(/<\/(h[1-3]|ul|hr|blockquote)><\/p>/g, "</$1>");
+  html = html.replace(
+    BLOCK_PARAGRAPH_PATTERN,
+    (_, open: string | undefined, close: string | undefined) =>
+      open ? `<${open}` : `</${close}>`,
+  );
 
   return `<div class="markdown-cell">${html}</div>`;
 }
 
 function renderSqlCell(cell: NotebookCell, index: number): string {
-  let html = `<div class="sql-cell">`;
+  // Collect fragments and join once; result tables can run to many rows.
+  const parts: string[] = [`<div class="sql-cell">`];
   const schemaLabel = cell.schema ? ` · <span style="color:#79c0ff">${escapeHtml(cell.schema)}</span>` : "";
-  html += `<div class="cell-header">SQL Cell #${index + 1}${schemaLabel}</div>`;
-  html += `<pre class="sql-code"><code>${escapeHtml(cell.content)}</code></pre>`;
+  parts.push(`<div class="cell-header">SQL Cell #${index + 1}${schemaLabel}</div>`);
+  parts.push(`<pre class="sql-code"><code>${escapeHtml(cell.content)}</code></pre>`);
 
   if (cell.error) {
-    html += `<div class="cell-error">${escapeHtml(cell.error)}</div>`;
+    parts.push(`<div class="cell-error">${escapeHtml(cell.error)}</div>`);
   }
 
   if (cell.result && cell.result.rows.length > 0) {
-    html += `<div class="cell-meta">${cell.result.rows.length} rows`;
+    parts.push(`<div class="cell-meta">${cell.result.rows.length} rows`);
     if (cell.executionTime != null) {
-      html += ` · ${Math.round(cell.executionTime)}ms`;
+      parts.push(` · ${Math.round(cell.executionTime)}ms`);
     }
-    html += `</div>`;
-    html += `<table class="result-table">`;
-    html += `<thead><tr>${cell.result.columns.map((c) => `<th>${escapeHtml(c)}</th>`).join("")}</tr></thead>`;
-    html += `<tbody>`;
+    parts.push(`</div>`);
+    parts.push(`<table class="result-table">`);
+    parts.push(`<thead><tr>${cell.result.columns.map((c) => `<th>${escapeHtml(c)}</th>`).join("")}</tr></thead>`);
+    parts.push(`<tbody>`);
     for (const row of cell.result.rows) {
-      html += `<tr>${row.map((v) => `<td>${v === null ? "<em>NULL</em>" : escapeHtml(String(v))}</td>`).join("")}</tr>`;
+      parts.push(`<tr>${row.map((v) => `<td>${v === null ? "<em>NULL</em>" : escapeHtml(String(v))}</td>`).join("")}</tr>`);
     }
-    html += `</tbody></table>`;
+    parts.push(`</tbody></table>`);
   }
 
-  html += `</div>`;
-  return html;
+  parts.push(`</div>`);
+  return parts.join("");
 }
 
 const CSS = `
@@ -101,14 +132,13 @@ export function exportNotebookToHtml(
   title: string,
   cells: NotebookCell[],
 ): string {
-  let body = "";
-  cells.forEach((cell, index) => {
-    if (cell.type === "markdown") {
-      body += renderMarkdownCell(cell.content);
-    } else {
-      body += renderSqlCell(cell, index);
-    }
-  });
+  const body = cells
+    .map((cell, index) =>
+      cell.type === "markdown"
+        ? renderMarkdownCell(cell.content)
+        : renderSqlCell(cell, index),
+    )
+    .join("");
 
   return `<!DOCTYPE html>
 <html lang="en">
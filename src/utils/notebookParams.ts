@@ -7,18 +7,23 @@ export interface ParamReference {
   name: string;
 }
 
+// PARAM_PATTERN is compiled once and shared; its lastIndex is reset before
+// every use so calls never inherit state from a previous global match.
 export function extractParamReferences(sql: string): ParamReference[] {
   const refs: ParamReference[] = [];
   let match: RegExpExecArray | null;
-  const regex = new RegExp(PARAM_PATTERN.source, "g");
-  while ((match = regex.exec(sql)) !== null) {
+  PARAM_PATTERN.lastIndex = 0;
+  while ((match = PARAM_PATTERN.exec(sql)) !== null) {
     refs.push({ match: match[0], name: match[1] });
   }
   return refs;
 }
 
 export function hasParamReferences(sql: string): boolean {
-  return PARAM_PATTERN.test(sql);
+  PARAM_PATTERN.lastIndex = 0;
+  const found = PARAM_PATTERN.test(sql);
+  PARAM_PATTERN.lastIndex = 0;
+  return found;
 }
 
 export function resolveParams(
@@ -29,23 +34,16 @@ export function resolveParams(
   if (refs.length === 0) return { sql, unresolvedParams: [] };
 
   const paramMap = new Map(params.map((p) => [p.name, p.value]));
-  const unresolvedParams: string[] = [];
-  let resolvedSql = sql;
+  const unresolvedParams = [...new Set(refs.map((r) => r.name))].filter(
+    (name) => !paramMap.has(name),
+  );
 
-  // Process refs in reverse order to avoid index shifting
-  const uniqueNames = [...new Set(refs.map((r) => r.name))];
-  for (const name of uniqueNames) {
-    const value = paramMap.get(name);
-    if (value === undefined) {
-      unresolvedParams.push(name);
-      continue;
-    }
-    // Replace all occurrences of @name with the value
-    resolvedSql = resolvedSql.replace(
-      new RegExp(`@${name}\\b`, "g"),
-      value,
-    );
-  }
+  // One pass with the shared pattern instead of compiling a regex per name;
+  // the callback also keeps `$` in values literal.
+  const resolvedSql = sql.replace(
+    PARAM_PATTERN,
+    (match, name: string) => paramMap.get(name) ?? match,
+  );
 
   return { sql: resolvedSql, unresolvedParams };
 }
@@ -1,5 +1,5 @@
 import { invoke } from "@tauri-apps/api/core";
-import type { NotebookState } from "../types/notebook";
+import type { NotebookFile, NotebookState } from "../types/notebook";
 import { createDefaultNotebookState } from "./notebook";
 import { serializeNotebook, deserializeNotebook } from "./notebookFile";
 
@@ -9,21 +9,50 @@ const SAVE_DEBOUNCE_MS = 1500;
 const cache = new Map<string, NotebookState>();
 const titleCache = new Map<string, string>();
 const saveTimers = new Map<string, ReturnType<typeof setTimeout>>();
+// Fingerprint of what is on disk per notebook, so unchanged saves are skipped
+const savedFingerprints = new Map<string, string>();
 
 function generateNotebookId(): string {
   return `nb_${Date.now().toString(36)}_${Math.random().toString(36).substring(2, 9)}`;
 }
 
-/** Serialize notebook state to JSON, stripping runtime fields. */
-function serializeForDisk(notebookId: string, state: NotebookState): string {
+/** Build the on-disk notebook from state, stripping runtime fields. */
+function toNotebookFile(notebookId: string, state: NotebookState): NotebookFile {
   const title = titleCache.get(notebookId) ?? "Notebook";
-  const notebook = serializeNotebook(
-    title,
-    state.cells,
-    state.params,
-    state.stopOnError,
-  );
-  return JSON.stringify(notebook, null, 2);
+  return serializeNotebook(title, state.cells, state.params, state.stopOnError);
+}
+
+/** Persisted content minus `createdAt`, which is re-stamped on every save. */
+function fingerprint(notebook: NotebookFile): string {
+  return JSON.stringify({ ...notebook, createdAt: "" });
+}
+
+/**
+ * Write the notebook unless nothing persisted changed since the last save
+ * (e.g. only results or loading flags were updated).
+ */
+async function persistNotebook(
+  notebookId: string,
+  state: NotebookState,
+): Promise<void> {
+  const notebook = toNotebookFile(notebookId, state);
+  const print = fingerprint(notebook);
+  if (savedFingerprints.get(notebookId) === print) return;
+
+  const content = JSON.stringify(notebook, null, 2);
+  await invoke("save_notebook", { notebookId, content });
+  savedFingerprints.set(notebookId, print);
+}
+
+/** Write a brand-new notebook file for `state`. */
+async function createNotebookFile(
+  notebookId: string,
+  state: NotebookState,
+): Promise<void> {
+  const notebook = toNotebookFile(notebookId, state);
+  const content = JSON.stringify(notebook, null, 2);
+  await invoke("create_notebook", { notebookId, content });
+  savedFingerprints.set(notebookId, fingerprint(notebook));
 }
 
 /** Flush a single pending save immediately. */
@@ -37,8 +66,7 @@ async function flushSave(notebookId: string): Promise<void> {
   const state = cache.get(notebookId);
   if (!state) return;
 
-  const content = serializeForDisk(notebookId, state);
-  await invoke("save_notebook", { notebookId, content });
+  await persistNotebook(notebookId, state);
 }
 
 /** Schedule a debounced save for a notebook. */
@@ -50,8 +78,7 @@ function scheduleSave(notebookId: string): void {
     saveTimers.delete(notebookId);
     const state = cache.get(notebookId);
     if (!state) return;
-    const content = serializeForDisk(notebookId, state);
-    invoke("save_notebook", { notebookId, content }).catch((e) =>
+    persistNotebook(notebookId, state).catch((e) =>
       console.error(`Failed to auto-save notebook ${notebookId}:`, e),
     );
   }, SAVE_DEBOUNCE_MS);
@@ -101,6 +128,7 @@ export async function loadNotebook(notebookId: string): Promise<NotebookState> {
   const state: NotebookState = { cells, params, stopOnError };
   cache.set(notebookId, state);
   titleCache.set(notebookId, title);
+  savedFingerprints.set(notebookId, fingerprint(toNotebookFile(notebookId, state)));
   return state;
 }
 
@@ -112,8 +140,7 @@ export async function createNotebook(title: string): Promise<{ notebookId: strin
   titleCache.set(notebookId, title);
   cache.set(notebookId, state);
 
-  const content = serializeForDisk(notebookId, state);
-  await invoke("create_notebook", { notebookId, content });
+  await createNotebookFile(notebookId, state);
 
   return { notebookId, state };
 }
@@ -128,8 +155,7 @@ export async function createNotebookFromState(
   titleCache.set(notebookId, title);
   cache.set(notebookId, state);
 
-  const content = serializeForDisk(notebookId, state);
-  await invoke("create_notebook", { notebookId, content });
+  await createNotebookFile(notebookId, state);
 
   return { notebookId };
 }
@@ -143,6 +169,7 @@ export async function deleteNotebook(notebookId: string): Promise<void> {
   }
   cache.delete(notebookId);
   titleCache.delete(notebookId);
+  savedFingerprints.delete(notebookId);
   await invoke("delete_notebook", { notebookId });
 }
 
@@ -151,6 +178,7 @@ export async function evictFromCache(notebookId: string): Promise<void> {
   await flushSave(notebookId);
   cache.delete(notebookId);
   titleCache.delete(notebookId);
+  savedFingerprints.delete(notebookId);
 }
 
 /** Flush all pending saves immediately (on app close). */
@@ -165,4 +193,5 @@ export function _resetForTesting(): void {
   saveTimers.clear();
   cache.clear();
   titleCache.clear();
+  savedFingerprints.clear();
 }
@@ -1,5 +1,6 @@
 import type { NotebookCell } from "../types/notebook";
 import type { QueryResult } from "../types/editor";
+import { quoteStringLiteral } from "./identifiers";
 
 const CELL_REF_PATTERN = /\{\{cell_(\d+)\}\}/g;
 
@@ -8,18 +9,23 @@ export interface CellReference {
   cellIndex: number;
 }
 
+// CELL_REF_PATTERN is compiled once and shared; its lastIndex is reset
+// before every use so calls never inherit state from a previous global match.
 export function extractCellReferences(sql: string): CellReference[] {
   const refs: CellReference[] = [];
   let match: RegExpExecArray | null;
-  const regex = new RegExp(CELL_REF_PATTERN.source, "g");
-  while ((match = regex.exec(sql)) !== null) {
+  CELL_REF_PATTERN.lastIndex = 0;
+  while ((match = CELL_REF_PATTERN.exec(sql)) !== null) {
     refs.push({ match: match[0], cellIndex: Number(match[1]) - 1 });
   }
   return refs;
 }
 
 export function hasCellReferences(sql: string): boolean {
-  return CELL_REF_PATTERN.test(sql);
+  CELL_REF_PATTERN.lastIndex = 0;
+  const found = CELL_REF_PATTERN.test(sql);
+  CELL_REF_PATTERN.lastIndex = 0;
+  return found;
 }
 
 function resultToCte(result: QueryResult, alias: string): string {
@@ -36,8 +42,7 @@ function resultToCte(result: QueryResult, alias: string): string {
         const val = row[i];
         if (val === null || val === undefined) return `NULL AS "${col}"`;
         if (typeof val === "number") return `${val} AS "${col}"`;
-        const escaped = String(val).replace(/'/g, "''");
-        return `'${escaped}' AS "${col}"`;
+        return `${quoteStringLiteral(String(val))} AS "${col}"`;
       })
       .join(", ");
     return `SELECT ${cols}`;
@@ -82,29 +87,31 @@ export function resolveQueryVariables(
   sql: string,
   cells: NotebookCell[],
 ): ResolvedQuery {
-  const refs = extractCellReferences(sql);
-  if (refs.length === 0) return { sql, unresolvedRefs: [] };
-
   const unresolvedRefs: CellReference[] = [];
   const ctes: string[] = [];
-  let resolvedSql = sql;
 
-  for (const ref of refs) {
-    const targetCell = cells[ref.cellIndex];
-    if (
-      !targetCell ||
-      targetCell.type !== "sql" ||
-      !targetCell.result ||
-      targetCell.error
-    ) {
-      unresolvedRefs.push(ref);
-      continue;
-    }
+  // One scan over the SQL: each reference is swapped for its CTE alias as it
+  // is matched, instead of re-searching the whole string once per reference.
+  let resolvedSql = sql.replace(
+    CELL_REF_PATTERN,
+    (match: string, cellNumber: string) => {
+      const ref = { match, cellIndex: Number(cellNumber) - 1 };
+      const targetCell = cells[ref.cellIndex];
+      if (
+        !targetCell ||
+        targetCell.type !== "sql" ||
+        !targetCell.result ||
+        targetCell.error
+      ) {
+        unresolvedRefs.push(ref);
+        return match;
+      }
 
-    const alias = `cell_${ref.cellIndex + 1}`;
-    ctes.push(resultToCte(targetCell.result, alias));
-    resolvedSql = resolvedSql.replace(ref.match, alias);
-  }
+      const alias = `cell_${ref.cellIndex + 1}`;
+      ctes.push(resultToCte(targetCell.result, alias));
+      return alias;
+    },
+  );
 
   if (ctes.length > 0) {
     resolvedSql = `WITH ${ctes.join(",\n")}\n${resolvedSql}`;
@@ -1,7 +1,14 @@
 export function parseAuthor(author: string): { name: string; url?: string } {
-  const match = author.match(/^(.+?)\s*<(.+?)>$/);
-  if (match) {
-    return { name: match[1].trim(), url: match[2].trim() };
+  // "Name <url>": the url runs from the first "<" after the name up to the
+  // trailing ">", so slice between those anchors instead of backtracking.
+  if (author.endsWith(">")) {
+    const open = author.indexOf("<", 1);
+    if (open !== -1 && open < author.length - 2) {
+      return {
+        name: author.slice(0, open).trim(),
+        url: author.slice(open + 1, -1).trim(),
+      };
+    }
   }
   return { name: author };
 }
@@ -1,5 +1,6 @@
 export const extractQueryParams = (sql: string): string[] => {
-  if (!sql) return [];
+  // No colon means no parameters: skip the regex scan entirely
+  if (!sql || !sql.includes(":")) return [];
   // Matches :paramName but ignores ::cast (Postgres)
   // Look for colon followed by word characters, ensuring it's not preceded by a colon
   const regex = /(?<!:):([a-zA-Z_][a-zA-Z0-9_]*)(?!\w)/g;
@@ -13,7 +14,8 @@ export const extractQueryParams = (sql: string): string[] => {
 
 export const interpolateQueryParams = (sql: string, params: Record<string, string>): string => {
   if (!sql) return "";
-  
+  if (!sql.includes(":")) return sql;
+
   // Values are substituted verbatim; callers are responsible for quoting.
   // SQL injection risk is accepted at the UI layer — this is a developer tool.
   return sql.replace(/(?<!:):([a-zA-Z_][a-zA-Z0-9_]*)(?!\w)/g, (match, paramName) => {
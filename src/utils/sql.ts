@@ -62,17 +62,87 @@ export function getExplainableQueries(
   );
 }
 
+/**
+ * Remove `--` line comments and `/* *\/` block comments in a single linear
+ * scan. Quoted literals and identifiers are copied through untouched, so
+ * comment markers inside strings are not mistaken for real comments.
+ * With `backslashEscapes` (MySQL/MariaDB), a backslash inside a `'` literal
+ * escapes the next character; otherwise it is an ordinary character, as in
+ * standard SQL.
+ */
+function stripSqlComments(sql: string, backslashEscapes: boolean): string {
+  const parts: string[] = [];
+  const len = sql.length;
+  let segmentStart = 0;
+  let i = 0;
+
+  while (i < len) {
+    const ch = sql[i];
+    if (ch === "'" || ch === '"' || ch === "`") {
+      const escapes = backslashEscapes && ch === "'";
+      i++;
+      while (i < len) {
+        if (escapes && sql[i] === "\\") {
+          i += 2;
+          continue;
+        }
+        if (sql[i] === ch) {
+          // A doubled quote is an escaped quote, not the end of the literal
+          if (sql[i + 1] === ch) {
+            i += 2;
+            continue;
+          }
+          break;
+        }
+        i++;
+      }
+      i++;
+    } else if (ch === "-" && sql[i + 1] === "-") {
+      parts.push(sql.slice(segmentStart, i));
+      const nl = sql.indexOf("\n", i + 2);
+      i = nl === -1 ? len : nl;
+      segmentStart = i;
+    } else if (ch === "/" && sql[i + 1] === "*") {
+      parts.push(sql.slice(segmentStart, i));
+      const end = sql.indexOf("*/", i + 2);
+      i = end === -1 ? len : end + 2;
+      segmentStart = i;
+    } else {
+      i++;
+    }
+  }
+
+  parts.push(sql.slice(segmentStart));
+  return parts.join("");
+}
+
+/**
+ * SELECT shapes whose rows cannot be edited against a single table, checked in
+ * one pass instead of one regex scan per rule:
+ * - DISTINCT: editing a row could affect deduplication
+ * - aggregates (COUNT, SUM, AVG, MIN, MAX, GROUP BY, HAVING): no table rows
+ * - JOIN: rows come from multiple tables
+ * - UNION / INTERSECT / EXCEPT: rows combine multiple queries
+ * - FROM (...): derived table
+ */
+const NON_EDITABLE_SELECT_PATTERN =
+  /\bSELECT\s+DISTINCT\b|\b(?:COUNT|SUM|AVG|MIN|MAX)\s*\(|\bGROUP\s+BY\b|\bHAVING\b|\bJOIN\b|\b(?:UNION|INTERSECT|EXCEPT)\b|\bFROM\s*\(/i;
+
 /**
  * Extracts the table name from a SELECT query.
  * Handles quotes: `table`, "table", 'table', and unquoted table names.
  * Returns null if no table is found or if it's not a SELECT query.
  * Returns null for aggregate queries (COUNT, SUM, etc.) since they don't return table rows.
+ *
+ * @param driver - The database driver; MySQL/MariaDB treat backslashes in string literals as escapes
  */
-export function extractTableName(sql: string): string | null {
+export function extractTableName(
+  sql: string,
+  driver?: string | null,
+): string | null {
   // Remove comments and normalize whitespace
-  const cleaned = sql
-    .replace(/--[^\n]*/g, '') // Remove line comments
-    .replace(/\/\*[\s\S]*?\*\//g, '') // Remove block comments
+  const backslashEscapes = driver === "mysql" || driver === "mariadb";
+  const cleaned = stripSqlComments(sql, backslashEscapes)
     .replace(/\s+/g, ' ') // Normalize whitespace
     .trim();
 
@@ -81,29 +151,8 @@ export function extractTableName(sql: string): string | null {
     return null;
   }
 
-  // DISTINCT removes duplicates - editing a row could affect deduplication
-  if (/\bSELECT\s+DISTINCT\b/i.test(cleaned)) {
-    return null;
-  }
-
-  // Check if it's an aggregate query (COUNT, SUM, AVG, MIN, MAX, GROUP BY, HAVING)
-  // These don't return table rows, so we shouldn't fetch PK
-  if (/\b(COUNT|SUM|AVG|MIN|MAX)\s*\(/i.test(cleaned) || /\bGROUP\s+BY\b/i.test(cleaned) || /\bHAVING\b/i.test(cleaned)) {
-    return null;
-  }
-
-  // JOINs produce rows from multiple tables - not safely editable against a single table
-  if (/\bJOIN\b/i.test(cleaned)) {
-    return null;
-  }
-
-  // Set operations combine results from multiple queries
-  if (/\b(UNION|INTERSECT|EXCEPT)\b/i.test(cleaned)) {
-    return null;
-  }
-
-  // Subquery in FROM clause (derived table)
-  if (/\bFROM\s*\(/i.test(cleaned)) {
+  // DISTINCT, aggregates, JOINs, set operations and derived tables
+  if (NON_EDITABLE_SELECT_PATTERN.test(cleaned)) {
     return null;
   }
 
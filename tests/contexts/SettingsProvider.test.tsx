@@ -241,6 +241,55 @@ describe("SettingsProvider", () => {
     });
   });
 
+  it("should not persist when a setting is set to its current value", async () => {
+    const wrapper = ({ children }: { children: React.ReactNode }) =>
+      React.createElement(SettingsProvider, null, children);
+
+    const { result } = renderHook(() => useSettings(), { wrapper });
+
+    await waitFor(() => {
+      expect(result.current.isLoading).toBe(false);
+    });
+
+    vi.mocked(invoke).mockClear();
+    const settingsBefore = result.current.settings;
+
+    await act(async () => {
+      await result.current.updateSetting("resultPageSize", 500);
+    });
+
+    expect(invoke).not.toHaveBeenCalledWith("save_config", expect.anything());
+    expect(result.current.settings).toBe(settingsBefore);
+  });
+
+  it("should persist a changed value after an unchanged update", async () => {
+    const wrapper = ({ children }: { children: React.ReactNode }) =>
+      React.createElement(SettingsProvider, null, children);
+
+    const { result } = renderHook(() => useSettings(), { wrapper });
+
+    await waitFor(() => {
+      expect(result.current.isLoading).toBe(false);
+    });
+
+    vi.mocked(invoke).mockClear();
+
+    await act(async () => {
+      await result.current.updateSetting("resultPageSize", 500);
+    });
+    await act(async () => {
+      await result.current.updateSetting("resultPageSize", 250);
+    });
+
+    expect(result.current.settings.resultPageSize).toBe(250);
+    expect(invoke).toHaveBeenCalledTimes(1);
+    expect(invoke).toHaveBeenCalledWith("save_config", {
+      config: expect.objectContaining({
+        resultPageSize: 250,
+      }),
+    });
+  });
+
   it("should change language when language setting is updated", async () => {
     const wrapper = ({ children }: { children: React.ReactNode }) =>
       React.createElement(SettingsProvider, null, children);
@@ -3,6 +3,7 @@ import {
   buildVisualExplainDeepLink,
   defaultExportFilename,
   eventsToCsvLines,
+  formatActivityTimestamp,
   formatDurationMs,
   getQueryKindBadgeStyle,
   getStatusBadgeStyle,
@@ -90,6 +91,27 @@ describe("truncateQuery", () => {
   });
 });
 
+describe("formatActivityTimestamp", () => {
+  it("replaces the date/time separator and drops fractions and offset", () => {
+    expect(formatActivityTimestamp("2026-03-04T05:06:07.123Z")).toBe(
+      "2026-03-04 05:06:07",
+    );
+  });
+
+  it("keeps timestamps without a separator", () => {
+    expect(formatActivityTimestamp("2026-03-04")).toBe("2026-03-04");
+  });
+
+  it("never returns more than 19 characters", () => {
+    expect(formatActivityTimestamp("2026-03-04 05:06:07.123 Tue")).toBe(
+      "2026-03-04 05:06:07",
+    );
+    expect(formatActivityTimestamp("2026-03-04 05:06:07 +01:00")).toBe(
+      "2026-03-04 05:06:07",
+    );
+  });
+});
+
 describe("formatDurationMs", () => {
   it("uses sub-millisecond bucket below 1ms", () => {
     expect(formatDurationMs(0.4)).toBe("<1 ms");
@@ -203,6 +225,15 @@ describe("buildVisualExplainDeepLink + parseVisualExplainDeepLink", () => {
     expect(parsed.query).toBe("SELECT 'a, b', \"c\" FROM users WHERE x = 1");
   });
 
+  it("round-trips queries whose base64 contains '+', '/' and padding", () => {
+    for (const query of ["SELECT '?>~'", "~~~", "SELECT 1 -- ÿþ"]) {
+      const url = buildVisualExplainDeepLink("c", query);
+      expect(url.split("&query=")[1]).toMatch(/^[A-Za-z0-9_-]+$/);
+      const parsed = parseVisualExplainDeepLink(url.split("?")[1]);
+      expect(parsed.query).toBe(query);
+    }
+  });
+
   it("returns nulls when params are missing", () => {
     const parsed = parseVisualExplainDeepLink("");
     expect(parsed.connectionId).toBeNull();
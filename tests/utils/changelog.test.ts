@@ -31,4 +31,13 @@ describe("parseChangelog", () => {
       bugFixes: ["Correct release packaging"],
     });
   });
+
+  it("cleans scope, commit link and inline code from padded lines", () => {
+    const entries = parseChangelog(
+      "## [1.0.0](https://example.com) (2026-05-01)\r\n### Features\r\n*   **editor:**   support `LIMIT` hints   ([abc1234](https://example.com/c))  \r\n",
+      {},
+    );
+
+    expect(entries[0].features).toEqual(["Support LIMIT hints"]);
+  });
 });
@@ -79,11 +79,23 @@ describe('CSV parsing', () => {
     expect(result.rows[0][1]).toBe('Rome, Italy');
   });
 
+  it('unescapes doubled quotes inside quoted fields', () => {
+    const result = parseClipboardText('name,quote\nAlice,"She said ""hi"", then left"\nBob,plain');
+    expect(result.rows[0]).toEqual(['Alice', 'She said "hi", then left']);
+    expect(result.rows[1]).toEqual(['Bob', 'plain']);
+  });
+
   it('handles semicolon separator', () => {
     const result = parseClipboardText('name;age\nAlice;30\nBob;25');
     expect(result.headers).toEqual(['name', 'age']);
     expect(result.rows[0]).toEqual(['Alice', '30']);
   });
+
+  it('picks the separator from the first line only', () => {
+    const result = parseClipboardText('name;note\nAlice;a,b,c\nBob;d,e');
+    expect(result.headers).toEqual(['name', 'note']);
+    expect(result.rows[0]).toEqual(['Alice', 'a,b,c']);
+  });
 });
 
 describe('Markdown table parsing', () => {
@@ -189,6 +189,12 @@ describe('dataGrid utils', () => {
       expect(getColumnSortState('name', 'name   ASC')).toBe('asc');
       expect(getColumnSortState('name', 'name  desc')).toBe('desc');
     });
+
+    it('should give the same answer when the same column is queried again', () => {
+      expect(getColumnSortState('name', 'name DESC')).toBe('desc');
+      expect(getColumnSortState('name', 'id DESC, name ASC')).toBe('asc');
+      expect(getColumnSortState('name', 'id DESC')).toBeNull();
+    });
   });
 
   describe('calculateSelectionRange', () => {
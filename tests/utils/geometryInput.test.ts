@@ -62,6 +62,12 @@ describe('extractWktFromSql', () => {
     expect(extractWktFromSql('ST_GeomFromText("POINT(1 2)")')).toBe('POINT(1 2)');
   });
 
+  it('should end the WKT at the first quote followed by the closing paren', () => {
+    expect(extractWktFromSql("ST_GeomFromText('a'b', 4326)")).toBe("a'b");
+    expect(extractWktFromSql("SELECT ST_GeomFromText('POINT(1 2)') FROM t")).toBe('POINT(1 2)');
+    expect(extractWktFromSql("ST_GeomFromText('POINT(1\n2)')")).toBeNull();
+  });
+
   it('should return null for non-matching strings', () => {
     expect(extractWktFromSql('POINT(1 2)')).toBeNull();
     expect(extractWktFromSql('ST_MakePoint(1, 2)')).toBeNull();
@@ -3,6 +3,7 @@ import {
   getQuoteChar,
   quoteIdentifier,
   quoteTableRef,
+  quoteStringLiteral,
 } from '../../src/utils/identifiers';
 
 describe('getQuoteChar', () => {
@@ -100,3 +101,15 @@ describe('quoteTableRef', () => {
     expect(quoteTableRef('my"table', 'postgres', 'my"schema')).toBe('"my""schema"."my""table"');
   });
 });
+
+describe('quoteStringLiteral', () => {
+  it('should wrap plain values in single quotes', () => {
+    expect(quoteStringLiteral('hello')).toBe("'hello'");
+    expect(quoteStringLiteral('')).toBe("''");
+  });
+
+  it('should double embedded single quotes', () => {
+    expect(quoteStringLiteral("O'Reilly")).toBe("'O''Reilly'");
+    expect(quoteStringLiteral("''")).toBe("''''''");
+  });
+});
@@ -0,0 +1,34 @@
+import { describe, it, expect } from 'vitest';
+import { QUERY_MARKER, splitQuery } from '../../src/utils/logs';
+
+describe('logs', () => {
+  describe('splitQuery', () => {
+    it('should split the preview from the query', () => {
+      expect(
+        splitQuery('Executing query on connection: abc | Query: SELECT * FROM users'),
+      ).toEqual({
+        preview: 'Executing query on connection: abc',
+        query: 'SELECT * FROM users',
+      });
+    });
+
+    it('should return null when the message has no marker', () => {
+      expect(splitQuery('Connection established')).toBeNull();
+      expect(splitQuery('')).toBeNull();
+    });
+
+    it('should return an empty preview when the marker is at position 0', () => {
+      expect(splitQuery(`${QUERY_MARKER} DELETE FROM logs`)).toEqual({
+        preview: '',
+        query: 'DELETE FROM logs',
+      });
+    });
+
+    it('should split on the first marker only', () => {
+      expect(splitQuery('run | Query: SELECT \'| Query:\'')).toEqual({
+        preview: 'run',
+        query: 'SELECT \'| Query:\'',
+      });
+    });
+  });
+});
@@ -32,6 +32,21 @@ describe("notebookHtmlExport", () => {
     expect(html).toContain('class="markdown-cell"');
   });
 
+  it("should render each heading level and ignore deeper hashes", () => {
+    const cells = [
+      makeCell({
+        type: "markdown",
+        content: "# One\n## Two\n### Three\n#### Four",
+      }),
+    ];
+    const html = exportNotebookToHtml("Test", cells);
+    expect(html).toContain("<h1>One</h1>");
+    expect(html).toContain("<h2>Two</h2>");
+    expect(html).toContain("<h3>Three</h3>");
+    expect(html).toContain("#### Four");
+    expect(html).not.toContain("<h4>");
+  });
+
   it("should render SQL cells with code", () => {
     const cells = [
       makeCell({ type: "sql", content: "SELECT * FROM users" }),
@@ -84,6 +99,16 @@ describe("notebookHtmlExport", () => {
     expect(html).toContain("&lt;script&gt;");
   });
 
+  it("should escape ampersands and quotes without double-escaping", () => {
+    const cells = [
+      makeCell({ type: "sql", content: `SELECT '"a" & b' AS x` }),
+    ];
+    const html = exportNotebookToHtml("Tom & Jerry", cells);
+    expect(html).toContain("<title>Tom &amp; Jerry</title>");
+    expect(html).toContain("SELECT '&quot;a&quot; &amp; b' AS x");
+    expect(html).not.toContain("&amp;amp;");
+  });
+
   it("should handle null values in result table", () => {
     const cells = [
       makeCell({
@@ -47,6 +47,11 @@ describe("notebookParams", () => {
     it("should return false when no params", () => {
       expect(hasParamReferences("SELECT 1")).toBe(false);
     });
+
+    it("should not depend on the previous call", () => {
+      expect(hasParamReferences("SELECT * WHERE id = @id")).toBe(true);
+      expect(hasParamReferences("@x")).toBe(true);
+    });
   });
 
   describe("resolveParams", () => {
@@ -83,6 +88,15 @@ describe("notebookParams", () => {
       );
       expect(result.sql).toBe("SELECT 100, 100");
     });
+
+    it("should insert values literally without re-expanding them", () => {
+      const result = resolveParams("SELECT @price, @alias", [
+        { name: "price", value: "'$&5'" },
+        { name: "alias", value: "@price" },
+      ]);
+      expect(result.sql).toBe("SELECT '$&5', @price");
+      expect(result.unresolvedParams).toEqual([]);
+    });
   });
 
   describe("validateParamName", () => {
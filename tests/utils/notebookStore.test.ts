@@ -104,6 +104,43 @@ describe("notebookStore", () => {
     });
   });
 
+  describe("unchanged saves", () => {
+    it("skips the write when only runtime fields changed", async () => {
+      setNotebookTitle("same-1", "Test");
+      setNotebookState("same-1", makeState("SELECT 1"));
+      await vi.advanceTimersByTimeAsync(1500);
+
+      setNotebookState("same-1", {
+        cells: [{ id: "c1", type: "sql", content: "SELECT 1", isLoading: true }],
+      });
+      await vi.advanceTimersByTimeAsync(1500);
+
+      const saveCalls = mockedInvoke.mock.calls.filter(
+        ([cmd]) => cmd === "save_notebook",
+      );
+      expect(saveCalls).toHaveLength(1);
+    });
+
+    it("does not rewrite a freshly loaded notebook on evict", async () => {
+      mockedInvoke.mockResolvedValueOnce(
+        JSON.stringify({
+          version: 2,
+          title: "Loaded",
+          createdAt: "2026-01-01",
+          cells: [{ type: "sql", content: "SELECT 42" }],
+        }),
+      );
+      await loadNotebook("same-2");
+
+      await evictFromCache("same-2");
+
+      expect(mockedInvoke).not.toHaveBeenCalledWith(
+        "save_notebook",
+        expect.anything(),
+      );
+    });
+  });
+
   describe("loadNotebook", () => {
     it("loads from Tauri backend and caches", async () => {
       const fileContent = JSON.stringify({
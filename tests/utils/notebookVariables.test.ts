@@ -55,6 +55,11 @@ describe("notebookVariables", () => {
     it("should return false when no references", () => {
       expect(hasCellReferences("SELECT 1")).toBe(false);
     });
+
+    it("should not depend on the previous call", () => {
+      expect(hasCellReferences("SELECT * FROM {{cell_1}} AS c")).toBe(true);
+      expect(hasCellReferences("{{cell_2}}")).toBe(true);
+    });
   });
 
   describe("resolveQueryVariables", () => {
@@ -143,6 +148,27 @@ describe("notebookVariables", () => {
       expect(result.unresolvedRefs).toEqual([]);
     });
 
+    it("should keep unresolved refs in place next to resolved ones", () => {
+      const cells = [
+        makeCell({
+          id: "c1",
+          type: "sql",
+          result: { columns: ["a"], rows: [[1]], affected_rows: 0 },
+        }),
+        makeCell({ id: "c2", type: "sql" }),
+      ];
+      const result = resolveQueryVariables(
+        "SELECT * FROM {{cell_2}} JOIN {{cell_1}} USING (a)",
+        cells,
+      );
+      expect(result.sql).toContain(
+        "SELECT * FROM {{cell_2}} JOIN cell_1 USING (a)",
+      );
+      expect(result.unresolvedRefs).toEqual([
+        { match: "{{cell_2}}", cellIndex: 1 },
+      ]);
+    });
+
     it("should escape single quotes in string values", () => {
       const cells = [
         makeCell({
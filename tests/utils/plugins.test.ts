@@ -33,6 +33,12 @@ describe('plugins', () => {
     it('should handle empty string', () => {
       expect(parseAuthor('')).toEqual({ name: '' });
     });
+
+    it('should not treat incomplete angle brackets as a url', () => {
+      expect(parseAuthor('<https://example.com>')).toEqual({ name: '<https://example.com>' });
+      expect(parseAuthor('debba <>')).toEqual({ name: 'debba <>' });
+      expect(parseAuthor('debba <https://example.com')).toEqual({ name: 'debba <https://example.com' });
+    });
   });
 
   describe('versionGte', () => {
@@ -195,5 +195,31 @@ describe('sql utils', () => {
     it('should return null for subquery in FROM clause', () => {
         expect(extractTableName('SELECT * FROM (SELECT * FROM users WHERE active = 1) sub')).toBeNull();
     });
+
+    it('should ignore line and block comments', () => {
+        expect(extractTableName('-- recent\nSELECT * FROM users /* all */ WHERE id = 1')).toBe('users');
+        expect(extractTableName('SELECT * /* JOIN */ FROM users -- UNION')).toBe('users');
+        expect(extractTableName('SELECT * FROM users /* unterminated')).toBe('users');
+    });
+
+    it('should not treat comment markers inside string literals as comments', () => {
+        expect(extractTableName("SELECT * FROM notes WHERE body = '--' AND id = 1")).toBe('notes');
+        expect(extractTableName("SELECT * FROM a WHERE x = '/*' UNION SELECT * FROM b WHERE y = '*/'")).toBeNull();
+    });
+
+    it('should treat backslash-escaped quotes as part of the literal for MySQL', () => {
+        expect(extractTableName("SELECT * FROM users WHERE name = 'O\\'Brien' /* join */", 'mysql')).toBe('users');
+        expect(extractTableName("SELECT * FROM files WHERE path = 'C:\\\\' -- union", 'mariadb')).toBe('files');
+    });
+
+    it('should treat a backslash as an ordinary character in standard SQL literals', () => {
+        expect(extractTableName("SELECT * FROM files WHERE path = 'C:\\' -- union", 'postgres')).toBe('files');
+        expect(extractTableName("SELECT * FROM files WHERE path = 'C:\\' /* join */")).toBe('files');
+    });
+
+    it('should not treat a backslash as an escape in double-quoted identifiers', () => {
+        expect(extractTableName('SELECT "a\\" FROM users -- join', 'postgres')).toBe('users');
+        expect(extractTableName('SELECT "a\\" FROM users /* union */', 'mysql')).toBe('users');
+    });
   });
 });